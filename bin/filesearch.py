@@ -9,16 +9,35 @@ import os
 import sys
 import argparse
 import re
+import stat
 import subprocess
 import json
+import bz2
+import codecs
 import csv
+import gzip
+import hashlib
+import lzma
+import sqlite3
+import tarfile
 import time
+import zipfile
+import zlib
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, Set, Optional, Tuple, Iterator, Union
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED
+from functools import lru_cache
+from itertools import chain
 import fnmatch
 import threading
 
+try:
+    import re._parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
 # Catppuccin Mocha Color Scheme
 class Colors:
     # Base colors
@@ -67,6 +86,8 @@ class ProgressIndicator:
         self.matches_found = 0
         self.thread = None
         self.lock = threading.Lock()
+        self.throttle: Optional['IOThrottle'] = None
+        self.started = time.monotonic()
 
     def start(self):
         """Start the progress indicator."""
@@ -93,7 +114,7 @@ class ProgressIndicator:
         if self.thread:
             self.thread.join()
         # Clear the progress line
-        sys.stderr.write('\r' + ' ' * 80 + '\r')
+        sys.stderr.write('\r' + ' ' * 120 + '\r')
         sys.stderr.flush()
 
     def _show_progress(self):
@@ -107,15 +128,1163 @@ class ProgressIndicator:
                       f"Scanned: {Colors.YELLOW}{self.dirs_scanned}{Colors.RESET} dirs, "
                       f"{Colors.YELLOW}{self.files_scanned}{Colors.RESET} files | "
                       f"Found: {Colors.GREEN}{self.matches_found}{Colors.RESET} matches")
+                if self.throttle:
+                    msg += f" | {Colors.OVERLAY0}nice-io {self.throttle.describe()}{Colors.RESET}"
                 sys.stderr.write(msg)
                 sys.stderr.flush()
 
             idx = (idx + 1) % len(spinner)
             time.sleep(0.1)
 
+class IOThrottle:
+    """Cap entries and bytes per second, scaling both down while directory listings are slow."""
+    BURST = 0.5           # Seconds of unused allowance that may be spent at once
+    SLOW_FACTOR = 3.0     # Listing latency this far above the quiet baseline means contention
+    BASELINE_RISE = 0.01  # Fraction of the gap to current latency the baseline closes per second
+    MIN_SCALE = 0.05
+
+    def __init__(self, entries_per_sec: float, bytes_per_sec: float):
+        self.entries_per_sec = entries_per_sec
+        self.bytes_per_sec = bytes_per_sec
+        self.scale = 1.0
+        self.latency: Optional[float] = None   # Moving average of listing time
+        self.baseline: Optional[float] = None  # Quiet latency: drops at once, creeps up slowly
+        self.last_adjust = time.monotonic()
+        self.ready = {'entries': 0.0, 'bytes': 0.0}  # When the allowance spent so far is paid off
+        self.lock = threading.Lock()
+
+    def _pace(self, kind: str, amount: int, rate: float):
+        """Sleep until amount fits under the scaled rate"""
+        if rate <= 0 or amount <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            ready = max(self.ready[kind], now - self.BURST) + amount / (rate * self.scale)
+            self.ready[kind] = ready
+        if ready > now:
+            time.sleep(ready - now)
+
+    def entries(self, count: int):
+        """Account for directory entries listed"""
+        self._pace('entries', count, self.entries_per_sec)
+
+    def read(self, size: int):
+        """Account for bytes about to be read"""
+        self._pace('bytes', size, self.bytes_per_sec)
+
+    def listing(self, elapsed: float):
+        """Feed one directory listing time; halve the caps under contention, recover slowly after"""
+        with self.lock:
+            self.latency = elapsed if self.latency is None else 0.8 * self.latency + 0.2 * elapsed
+            self.baseline = self.latency if self.baseline is None else min(self.baseline, self.latency)
+            now = time.monotonic()
+            if now - self.last_adjust < 1.0:
+                return
+            # Let the baseline drift up to a lasting change (slower disk, colder cache),
+            # otherwise one quiet burst early on would pin the caps at MIN_SCALE forever
+            rise = 1.0 - (1.0 - self.BASELINE_RISE) ** (now - self.last_adjust)
+            self.baseline += (self.latency - self.baseline) * rise
+            self.last_adjust = now
+            if self.latency > self.baseline * self.SLOW_FACTOR:
+                self.scale = max(self.MIN_SCALE, self.scale / 2)
+            else:
+                self.scale = min(1.0, self.scale + 0.1)
+
+    def describe(self) -> str:
+        """Current effective caps for the progress line"""
+        caps = []
+        if self.entries_per_sec > 0:
+            caps.append(f"{self.entries_per_sec * self.scale:.0f} entries/s")
+        if self.bytes_per_sec > 0:
+            caps.append(f"{self.bytes_per_sec * self.scale / (1024 * 1024):.1f} MB/s")
+        return f"≤{', '.join(caps)} ({self.scale:.0%})"
+
+class ExecRunner:
+    """Run a command on search results in argv-limited batches across worker threads."""
+    def __init__(self, command: List[str], jobs: int = 0, batch: bool = True):
+        self.command = command
+        self.batch = batch
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.base_size = sum(len(os.fsencode(arg)) + 1 for arg in command if arg != '{}')
+        self.arg_limit = self._arg_limit()
+        self.executor = ThreadPoolExecutor(max_workers=self.jobs)
+        self.futures = set()
+        self.pending: List[str] = []
+        self.pending_size = 0
+        self.files_run = 0
+        self.batches_run = 0
+        self.statuses: Dict[int, int] = {}  # exit status -> number of batches
+
+    def _arg_limit(self) -> int:
+        """Bytes available for file arguments, leaving room for the environment like xargs."""
+        try:
+            arg_max = os.sysconf('SC_ARG_MAX')
+        except (ValueError, OSError):
+            arg_max = 128 * 1024
+        env_size = sum(len(k) + len(v) + 2 for k, v in os.environ.items())
+        limit = min(arg_max - env_size - 2048, 128 * 1024) - self.base_size
+        return max(limit, 4096)
+
+    def submit(self, path: str):
+        """Queue a result path, launching a batch once it would overflow the argv limit."""
+        size = len(os.fsencode(path)) + 1
+        if self.pending and self.pending_size + size > self.arg_limit:
+            self._flush()
+        self.pending.append(path)
+        self.pending_size += size
+        if not self.batch:
+            self._flush()
+
+    def _flush(self):
+        """Hand the pending batch to a worker, waiting if too many are in flight."""
+        if not self.pending:
+            return
+
+        if '{}' in self.command:
+            idx = self.command.index('{}')
+            argv = self.command[:idx] + self.pending + self.command[idx + 1:]
+        else:
+            argv = self.command + self.pending
+
+        # Bound in-flight batches so a fast walker can't queue the whole result set
+        while len(self.futures) >= self.jobs * 2:
+            done, self.futures = wait(self.futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._collect(future)
+
+        self.futures.add(self.executor.submit(self._run, argv, len(self.pending)))
+        self.pending = []
+        self.pending_size = 0
+
+    def _run(self, argv: List[str], count: int) -> Tuple[int, int]:
+        """Execute one batch and return (exit status, file count)."""
+        try:
+            return subprocess.run(argv).returncode, count
+        except FileNotFoundError:
+            print(f"{Colors.RED}Command not found: {argv[0]}{Colors.RESET}", file=sys.stderr)
+            return 127, count
+        except OSError as e:
+            print(f"{Colors.RED}Could not run {argv[0]}: {e}{Colors.RESET}", file=sys.stderr)
+            return 126, count
+
+    def _collect(self, future):
+        """Record the exit status of a finished batch."""
+        status, count = future.result()
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.files_run += count
+        self.batches_run += 1
+
+    def close(self, abort: bool = False):
+        """Run any remaining batch and wait for all workers to finish; on abort the pending batch is dropped."""
+        if abort:
+            self.pending = []
+            self.pending_size = 0
+        else:
+            self._flush()
+        for future in self.futures:
+            self._collect(future)
+        self.futures = set()
+        self.executor.shutdown(wait=True)
+
+    @property
+    def failed(self) -> int:
+        """Number of batches that exited non-zero."""
+        return sum(n for status, n in self.statuses.items() if status != 0)
+
+    def print_summary(self):
+        """Print exit status counts for all executed batches."""
+        color = Colors.GREEN if not self.failed else Colors.RED
+        print(f"{color}Exec: {self.files_run} files in {self.batches_run} batches "
+              f"({self.jobs} workers), {self.failed} failed{Colors.RESET}", file=sys.stderr)
+        for status in sorted(s for s in self.statuses if s != 0):
+            print(f"  {Colors.YELLOW}exit {status}:{Colors.RESET} {self.statuses[status]} batches",
+                  file=sys.stderr)
+
+class StreamExporter(ABC):
+    """Base for exporters that write each result as the walker yields it."""
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self.count = 0
+
+    def record(self, filepath: Path, stat_info: os.stat_result, matched: Optional[str] = None,
+               is_symlink: Optional[bool] = None) -> Dict:
+        """Build an export record from the stat and directory entry type already taken by the walk."""
+        is_dir = stat.S_ISDIR(stat_info.st_mode)
+        if is_symlink is None:
+            is_symlink = filepath.is_symlink()
+        target = None
+        if is_symlink:
+            try:
+                target = os.readlink(filepath)
+            except (OSError, IOError):
+                pass
+        return {
+            'path': str(filepath),
+            'name': filepath.name,
+            'type': 'directory' if is_dir else 'file',
+            'size': None if is_dir else stat_info.st_size,
+            'modified': datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
+            'is_symlink': is_symlink,
+            'symlink_target': target,
+            'pattern': matched
+        }
+
+    @abstractmethod
+    def write(self, filepath: Path, stat_info: os.stat_result, matched: Optional[str] = None,
+              is_symlink: Optional[bool] = None):
+        """Export one result; is_symlink is None when the walk did not list it."""
+
+    def close(self):
+        print(f"{Colors.GREEN}{self.count} results exported to {self.output_file}{Colors.RESET}")
+
+class JsonLinesExporter(StreamExporter):
+    """Write one JSON object per line as results are found."""
+    def __init__(self, output_file: str):
+        super().__init__(output_file)
+        self.file = open(output_file, 'w')
+
+    def write(self, filepath: Path, stat_info: os.stat_result, matched: Optional[str] = None,
+              is_symlink: Optional[bool] = None):
+        self.file.write(json.dumps(self.record(filepath, stat_info, matched, is_symlink)) + '\n')
+        self.count += 1
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+class JsonExporter(StreamExporter):
+    """Write a JSON array of results, one element at a time, laid out like json.dump(indent=2)."""
+    def __init__(self, output_file: str):
+        super().__init__(output_file)
+        self.file = open(output_file, 'w')
+        self.file.write('[')
+
+    def write(self, filepath: Path, stat_info: os.stat_result, matched: Optional[str] = None,
+              is_symlink: Optional[bool] = None):
+        item = json.dumps(self.record(filepath, stat_info, matched, is_symlink), indent=2)
+        self.file.write((',\n  ' if self.count else '\n  ') + item.replace('\n', '\n  '))
+        self.count += 1
+
+    def close(self):
+        self.file.write('\n]' if self.count else ']')
+        self.file.close()
+        super().close()
+
+class CsvExporter(StreamExporter):
+    """Write one CSV row per result as results are found."""
+    HEADER = ['Path', 'Name', 'Type', 'Size (bytes)', 'Modified', 'Is Symlink', 'Symlink Target']
+
+    def __init__(self, output_file: str):
+        super().__init__(output_file)
+        self.file = open(output_file, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.HEADER)
+
+    def write(self, filepath: Path, stat_info: os.stat_result, matched: Optional[str] = None,
+              is_symlink: Optional[bool] = None):
+        item = self.record(filepath, stat_info, matched, is_symlink)
+        self.writer.writerow([item['path'], item['name'], item['type'],
+                              '' if item['size'] is None else item['size'], item['modified'],
+                              'yes' if item['is_symlink'] else 'no', item['symlink_target'] or ''])
+        self.count += 1
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+class SqliteExporter(StreamExporter):
+    """Insert results into a SQLite table in batches within a single transaction."""
+    BATCH_SIZE = 1000
+    COLUMNS = ('path', 'name', 'type', 'size', 'modified', 'is_symlink', 'symlink_target', 'pattern')
+
+    def __init__(self, output_file: str):
+        super().__init__(output_file)
+        self.conn = sqlite3.connect(output_file)
+        self.conn.execute('PRAGMA journal_mode=MEMORY')
+        self.conn.execute('PRAGMA synchronous=OFF')
+        self.conn.execute('DROP TABLE IF EXISTS results')
+        self.conn.execute('CREATE TABLE results (path TEXT, name TEXT, type TEXT, size INTEGER, '
+                          'modified TEXT, is_symlink INTEGER, symlink_target TEXT, pattern TEXT)')
+        self.rows = []
+
+    def write(self, filepath: Path, stat_info: os.stat_result, matched: Optional[str] = None,
+              is_symlink: Optional[bool] = None):
+        item = self.record(filepath, stat_info, matched, is_symlink)
+        self.rows.append(tuple(item[col] for col in self.COLUMNS))
+        self.count += 1
+        if len(self.rows) >= self.BATCH_SIZE:
+            self._insert()
+
+    def _insert(self):
+        placeholders = ', '.join('?' * len(self.COLUMNS))
+        self.conn.executemany(f"INSERT INTO results VALUES ({placeholders})", self.rows)
+        self.rows = []
+
+    def close(self):
+        if self.rows:
+            self._insert()
+        self.conn.commit()
+        self.conn.close()
+        super().close()
+
+# Leading bytes of common binary formats that may not contain NULs early on
+BINARY_MAGIC = (
+    b'\x7fELF', b'\x89PNG', b'\xff\xd8\xff', b'GIF8', b'PK\x03\x04', b'\x1f\x8b',
+    b'BZh', b'\xfd7zXZ', b'7z\xbc\xaf', b'Rar!', b'SQLite format 3', b'%PDF',
+    b'OggS', b'fLaC', b'ID3', b'RIFF', b'\x00asm', b'\xca\xfe\xba\xbe'
+)
+SNIFF_SIZE = 8192
+
+def sniff_encoding(head: bytes) -> str:
+    """Guess the text encoding of a file from its first bytes ('' means binary)."""
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    if head.startswith(BINARY_MAGIC) or b'\x00' in head:
+        return ''
+    return 'utf-8'
+
+def _literal_runs(items, out: List[str]):
+    """Collect runs of literal characters that every match of a parsed regex must contain."""
+    run = []
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            out.append(''.join(run))
+            run = []
+        if op is sre_parse.SUBPATTERN:
+            add_flags, sub = av[1], av[3]
+            if not add_flags & re.IGNORECASE:
+                _literal_runs(sub, out)
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            _literal_runs(av[2], out)
+        elif op is getattr(sre_parse, 'ATOMIC_GROUP', None):
+            _literal_runs(av, out)
+        elif op is getattr(sre_parse, 'POSSESSIVE_REPEAT', None) and av[0] >= 1:
+            _literal_runs(av[2], out)
+    if run:
+        out.append(''.join(run))
+
+@lru_cache(maxsize=64)
+def required_literals(pattern: str, use_regex: bool, case_sensitive: bool) -> Tuple[bytes, ...]:
+    """Extract UTF-8 literals every content match must contain (e.g. 'foo.*bar' -> foo, bar)."""
+    if not case_sensitive:
+        pattern = pattern.lower()
+    regex = pattern if use_regex else fnmatch.translate(f"*{pattern}*")
+    try:
+        parsed = sre_parse.parse(regex)
+    except (re.error, RecursionError):
+        return ()
+    if parsed.state.flags & re.IGNORECASE:
+        return ()
+
+    runs = []
+    _literal_runs(parsed, runs)
+    # Case-insensitive checks lower the raw bytes, which only folds ASCII
+    if not case_sensitive:
+        runs = [lit for lit in runs if lit.isascii()]
+    runs.sort(key=len, reverse=True)
+    return tuple(lit.encode('utf-8') for lit in runs[:3])
+
+# Archives whose members are listed (and searched with -c), and single-file compressors
+ARCHIVE_SUFFIXES = {
+    '.zip': 'zip', '.jar': 'zip', '.tar': 'tar', '.tgz': 'tar', '.tbz2': 'tar', '.txz': 'tar',
+    '.tar.gz': 'tar', '.tar.bz2': 'tar', '.tar.xz': 'tar'
+}
+COMPRESSED_OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+ARCHIVE_SEP = '!/'
+CHUNK_SIZE = 1024 * 1024
+
+def archive_kind(name: str) -> Optional[str]:
+    """Return 'zip', 'tar' or 'compressed' for searchable archive names, else None."""
+    name = name.lower()
+    for suffix, kind in ARCHIVE_SUFFIXES.items():
+        if name.endswith(suffix):
+            return kind
+    if os.path.splitext(name)[1] in COMPRESSED_OPENERS:
+        return 'compressed'
+    return None
+
+def member_stat(is_dir: bool, size: int, mtime: float) -> os.stat_result:
+    """Synthetic stat for an archive member; st_dev and st_ino are 0 since it has no inode."""
+    mode = (stat.S_IFDIR | 0o755) if is_dir else (stat.S_IFREG | 0o644)
+    return os.stat_result((mode, 0, 0, 1, 0, 0, size, mtime, mtime, mtime))
+
+def glob_to_regex(pattern: str) -> str:
+    """Regex source that finds a glob anywhere in text, like fnmatch against '*pattern*'."""
+    source = fnmatch.translate(pattern)
+    # Dropping the end anchor lets re.search scan linearly instead of backtracking '.*'
+    return source[:-2] if source.endswith('\\Z') else source
+
+@lru_cache(maxsize=4096)
+def compile_ignore_rule(line: str) -> Optional[Tuple['re.Pattern', bool, bool, bool]]:
+    """Compile one .gitignore line into (regex, negate, dir_only, anchored), or None."""
+    if not line.strip() or line.startswith('#'):
+        return None
+
+    # Trailing spaces are ignored unless escaped
+    stripped = line.rstrip(' ')
+    if stripped.endswith('\\') and len(stripped) < len(line):
+        stripped += ' '
+    line = stripped
+
+    negate = line.startswith('!')
+    if negate:
+        line = line[1:]
+    elif line.startswith(('\\!', '\\#')):
+        line = line[1:]
+
+    dir_only = line.endswith('/')
+    line = line.rstrip('/')
+    if not line:
+        return None
+    # A slash anywhere but the end anchors the pattern to the ignore file's directory
+    anchored = '/' in line
+    line = line.lstrip('/')
+
+    out = []
+    i = 0
+    while i < len(line):
+        c = line[i]
+        if c == '*':
+            at_segment_start = i == 0 or line[i - 1] == '/'
+            if line.startswith('**', i) and at_segment_start and line[i + 2:i + 3] == '/':
+                out.append('(?:.*/)?')  # '**/' matches zero or more directories
+                i += 3
+                continue
+            if line.startswith('**', i) and at_segment_start and i + 2 == len(line):
+                out.append('.*')  # trailing '/**' matches everything inside
+                i += 2
+                continue
+            out.append('[^/]*')
+            i += 2 if line.startswith('**', i) else 1
+            continue
+        if c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            end = line.find(']', i + 2)
+            if end == -1:
+                out.append('\\[')
+            else:
+                body = line[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                out.append(f'[{body}]')
+                i = end
+        elif c == '\\' and i + 1 < len(line):
+            i += 1
+            out.append(re.escape(line[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+
+    prefix = '' if anchored else '(?:.*/)?'
+    try:
+        return re.compile(prefix + ''.join(out) + '$'), negate, dir_only, anchored
+    except re.error:
+        return None
+
+class IgnoreRules:
+    """Compiled .gitignore/.ignore rules for a directory, including inherited parent rules."""
+    IGNORE_FILES = ('.gitignore', '.ignore')
+
+    def __init__(self, rules: List[Tuple[str, 're.Pattern', bool, bool]]):
+        self.rules = rules  # (base prefix, regex, negate, dir_only), later rules win
+
+    @classmethod
+    def for_directory(cls, directory: str, parent: Optional['IgnoreRules']) -> Optional['IgnoreRules']:
+        """Extend the parent's rules with this directory's ignore files (shared if it has none)."""
+        prefix = directory.rstrip('/') + '/'
+        rules = []
+        for name in cls.IGNORE_FILES:
+            try:
+                with open(os.path.join(directory, name), 'r', errors='ignore') as f:
+                    lines = f.read().splitlines()
+            except OSError:
+                continue
+            for line in lines:
+                rule = compile_ignore_rule(line)
+                if rule:
+                    rules.append((prefix, rule[0], rule[1], rule[2]))
+
+        if not rules:
+            return parent
+        return cls((parent.rules if parent else []) + rules)
+
+    def ignored(self, path: str, is_dir: bool) -> bool:
+        """Check whether the last matching rule ignores path."""
+        result = False
+        for prefix, regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(path[len(prefix):]):
+                result = not negate
+        return result
+
+class PatternSet:
+    """Match text against several patterns at once through one combined regex."""
+    def __init__(self, patterns: List[str], use_regex: bool = False, case_sensitive: bool = False):
+        self.patterns = patterns
+        self.use_regex = use_regex
+        self.case_sensitive = case_sensitive
+        self.compiled = []
+        for pattern in patterns:
+            source = pattern if case_sensitive else pattern.lower()
+            if not use_regex:
+                source = glob_to_regex(source)
+            try:
+                self.compiled.append(re.compile(source))
+            except re.error as e:
+                raise ValueError(f"Invalid regex pattern: {pattern} ({e})")
+
+        # Named alternatives let one search report which pattern matched. Patterns
+        # with their own groups (backreferences) or global inline flags can't be
+        # merged safely, so those fall back to one regex per pattern.
+        self.combined = None
+        if len(self.compiled) > 1 and not any(c.groups for c in self.compiled):
+            try:
+                self.combined = re.compile('|'.join(
+                    f'(?P<_p{i}>{c.pattern})' for i, c in enumerate(self.compiled)))
+            except re.error:
+                pass
+        self._bytes_set = None
+
+    def __str__(self) -> str:
+        return ', '.join(self.patterns)
+
+    def match(self, text: str) -> Optional[int]:
+        """Return the index of the first pattern matching text, or None."""
+        if not self.case_sensitive:
+            text = text.lower()
+        if self.combined:
+            m = self.combined.search(text)
+            return int(m.lastgroup[2:]) if m else None
+        for i, regex in enumerate(self.compiled):
+            if regex.search(text):
+                return i
+        return None
+
+    def for_bytes(self) -> 'PatternSet':
+        """Equivalent set for raw bytes decoded as latin-1 (one character per byte)."""
+        if self._bytes_set is None:
+            self._bytes_set = PatternSet([p.encode('utf-8').decode('latin-1') for p in self.patterns],
+                                         self.use_regex, self.case_sensitive)
+        return self._bytes_set
+
+    def may_match(self, data: bytes) -> bool:
+        """Cheaply reject data that lacks a required literal of every pattern."""
+        haystack = None
+        for pattern in self.patterns:
+            literals = required_literals(pattern, self.use_regex, self.case_sensitive)
+            if not literals:
+                return True
+            if haystack is None:
+                haystack = data if self.case_sensitive else data.lower()
+            if all(haystack.find(literal) != -1 for literal in literals):
+                return True
+        return False
+
+class ContentCache:
+    """Persistent per-file content match verdicts keyed by inode, size, mtime and query."""
+    def __init__(self, cache_file: Path, query: str, max_entries: int = 100000):
+        self.cache_file = cache_file
+        self.query = query
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.updates = []
+        self.used = []
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(cache_file))
+        self.conn.execute('CREATE TABLE IF NOT EXISTS verdicts (dev INTEGER, ino INTEGER, '
+                          'size INTEGER, mtime_ns INTEGER, query TEXT, matched INTEGER, '
+                          'used REAL, PRIMARY KEY (dev, ino, query))')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS verdicts_used ON verdicts (used)')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS encodings (dev INTEGER, ino INTEGER, '
+                          'size INTEGER, mtime_ns INTEGER, encoding TEXT, used REAL, '
+                          'PRIMARY KEY (dev, ino))')
+
+        # Load this query's verdicts up front so lookups never hit the database
+        self.verdicts = {
+            (dev, ino): (size, mtime_ns, matched)
+            for dev, ino, size, mtime_ns, matched in self.conn.execute(
+                'SELECT dev, ino, size, mtime_ns, matched FROM verdicts WHERE query = ?', (query,))
+        }
+        # Sniffed encodings are shared by every query
+        self.encodings = {
+            (dev, ino): (size, mtime_ns, encoding)
+            for dev, ino, size, mtime_ns, encoding in self.conn.execute(
+                'SELECT dev, ino, size, mtime_ns, encoding FROM encodings')
+        }
+        self.encoding_updates = []
+
+    def get(self, stat_info: os.stat_result) -> Optional[int]:
+        """Return the cached verdict (0 = no match, else 1 + pattern index) if unchanged, else None."""
+        entry = self.verdicts.get((stat_info.st_dev, stat_info.st_ino))
+        if entry is None or entry[:2] != (stat_info.st_size, stat_info.st_mtime_ns):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.used.append((stat_info.st_dev, stat_info.st_ino))
+        return entry[2]
+
+    def put(self, stat_info: os.stat_result, matched: int):
+        """Record a freshly computed verdict."""
+        key = (stat_info.st_dev, stat_info.st_ino)
+        self.verdicts[key] = (stat_info.st_size, stat_info.st_mtime_ns, matched)
+        self.updates.append(key)
+
+    def get_encoding(self, stat_info: os.stat_result) -> Optional[str]:
+        """Return the sniffed encoding ('' for binary) if the file is unchanged, else None."""
+        entry = self.encodings.get((stat_info.st_dev, stat_info.st_ino))
+        if entry is None or entry[:2] != (stat_info.st_size, stat_info.st_mtime_ns):
+            return None
+        return entry[2]
+
+    def put_encoding(self, stat_info: os.stat_result, encoding: str):
+        """Record the sniffed encoding of a file."""
+        key = (stat_info.st_dev, stat_info.st_ino)
+        self.encodings[key] = (stat_info.st_size, stat_info.st_mtime_ns, encoding)
+        self.encoding_updates.append(key)
+
+    def close(self):
+        """Write new verdicts, refresh LRU timestamps and evict the oldest entries."""
+        now = time.time()
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    'INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    ((dev, ino, *self.verdicts[(dev, ino)][:2], self.query,
+                      self.verdicts[(dev, ino)][2], now) for dev, ino in self.updates))
+                self.conn.executemany(
+                    'UPDATE verdicts SET used = ? WHERE dev = ? AND ino = ? AND query = ?',
+                    ((now, dev, ino, self.query) for dev, ino in self.used))
+
+                self.conn.executemany(
+                    'INSERT OR REPLACE INTO encodings VALUES (?, ?, ?, ?, ?, ?)',
+                    ((dev, ino, *self.encodings[(dev, ino)], now)
+                     for dev, ino in self.encoding_updates))
+
+                for table in ('verdicts', 'encodings'):
+                    count = self.conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                    if count > self.max_entries:
+                        self.conn.execute(f'DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM '
+                                          f'{table} ORDER BY used LIMIT ?)', (count - self.max_entries,))
+        except sqlite3.Error as e:
+            print(f"{Colors.YELLOW}Warning: Could not update content cache: {e}{Colors.RESET}",
+                  file=sys.stderr)
+        finally:
+            self.conn.close()
+
+class UnreadableDirs:
+    """Persistent negative cache of directories that could not be listed, valid while their inode is unchanged."""
+    def __init__(self, cache_file: Path, max_entries: int = 10000):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        # Denied for one user isn't denied for another, nor after the user joins a group
+        self.creds = f"{os.geteuid()}:{os.getegid()}:{','.join(map(str, sorted(set(os.getgroups()))))}"
+        self.hits = 0
+        self.added: Dict[Tuple[int, int], Tuple[int, int, str]] = {}
+        self.stale: List[Tuple[int, int]] = []
+        self.used: List[Tuple[int, int]] = []
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(cache_file))
+        self.conn.execute('DROP TABLE IF EXISTS unreadable')  # Keyed by uid alone
+        self.conn.execute('CREATE TABLE IF NOT EXISTS unreadable_dirs (creds TEXT, dev INTEGER, ino INTEGER, '
+                          'mtime_ns INTEGER, ctime_ns INTEGER, path TEXT, used REAL, '
+                          'PRIMARY KEY (creds, dev, ino))')
+        self.dirs = {
+            (dev, ino): (mtime_ns, ctime_ns)
+            for dev, ino, mtime_ns, ctime_ns in self.conn.execute(
+                'SELECT dev, ino, mtime_ns, ctime_ns FROM unreadable_dirs WHERE creds = ?', (self.creds,))
+        }
+
+    def known(self, stat_info: os.stat_result) -> bool:
+        """Whether the directory failed before and neither its contents nor its permissions changed since"""
+        key = (stat_info.st_dev, stat_info.st_ino)
+        entry = self.dirs.get(key)
+        if entry is None:
+            return False
+        # chmod/chown only move ctime, so both times have to match
+        if entry != (stat_info.st_mtime_ns, stat_info.st_ctime_ns):
+            del self.dirs[key]
+            self.stale.append(key)
+            return False
+        self.hits += 1
+        self.used.append(key)
+        return True
+
+    def add(self, stat_info: os.stat_result, path: str):
+        """Record a directory that could not be listed"""
+        key = (stat_info.st_dev, stat_info.st_ino)
+        self.dirs[key] = (stat_info.st_mtime_ns, stat_info.st_ctime_ns)
+        self.added[key] = (stat_info.st_mtime_ns, stat_info.st_ctime_ns, path)
+
+    def close(self):
+        """Write new entries, drop stale ones and evict the least recently used"""
+        now = time.time()
+        try:
+            with self.conn:
+                self.conn.executemany('DELETE FROM unreadable_dirs WHERE creds = ? AND dev = ? AND ino = ?',
+                                      ((self.creds, *key) for key in self.stale))
+                self.conn.executemany('INSERT OR REPLACE INTO unreadable_dirs VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                      ((self.creds, *key, *entry, now) for key, entry in self.added.items()))
+                self.conn.executemany('UPDATE unreadable_dirs SET used = ? WHERE creds = ? AND dev = ? AND ino = ?',
+                                      ((now, self.creds, *key) for key in self.used))
+                count = self.conn.execute('SELECT COUNT(*) FROM unreadable_dirs').fetchone()[0]
+                if count > self.max_entries:
+                    self.conn.execute('DELETE FROM unreadable_dirs WHERE rowid IN (SELECT rowid FROM '
+                                      'unreadable_dirs ORDER BY used LIMIT ?)', (count - self.max_entries,))
+        except sqlite3.Error as e:
+            print(f"{Colors.YELLOW}Warning: Could not update unreadable directory cache: {e}{Colors.RESET}",
+                  file=sys.stderr)
+        finally:
+            self.conn.close()
+
+def trigrams(text: str) -> Set[str]:
+    """Distinct three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def fuzzy_distance(query: str, text: str) -> int:
+    """Edit distance from query to its best-matching substring of text."""
+    # Semi-global alignment: skipping a prefix or suffix of text is free
+    previous = [0] * (len(text) + 1)
+    for i, qc in enumerate(query, 1):
+        current = [i] + [0] * len(text)
+        for j, tc in enumerate(text, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (qc != tc))
+        previous = current
+    return min(previous)
+
+def entry_digest(name: str, mode: int, size: int, mtime_ns: int, subtree: int = 0) -> int:
+    """63-bit hash of one directory entry, summed into its parent's subtree digest."""
+    data = f"{name}\0{mode}\0{size}\0{mtime_ns}\0{subtree}".encode('utf-8', 'surrogateescape')
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'big') >> 1
+
+def stored_stat(mode: int, size: int, mtime_ns: int, uid: int, gid: int, dev: int, ino: int) -> os.stat_result:
+    """Rebuild a stat result from the metadata stored in an index or checkpoint."""
+    mtime = mtime_ns / 1e9
+    return os.stat_result((mode, ino, dev, 1, uid, gid, size, int(mtime), int(mtime), int(mtime),
+                           mtime, mtime, mtime, mtime_ns, mtime_ns, mtime_ns))
+
+class AccessFilter:
+    """Hide indexed paths the current user could not list, judged from indexed metadata.
+
+    A convenience, not a permission boundary: it runs in the user's own process, and anyone who
+    can read the index file can read every path in it. Access is decided by who may read the file.
+    """
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.uid = os.geteuid()
+        self.groups = set(os.getgroups()) | {os.getegid()}
+        self.dirs: Dict[str, Tuple[bool, bool]] = {}  # dir -> (reachable, readable)
+
+    def _bits(self, mode: int, uid: int, gid: int) -> int:
+        """Permission bits that apply to the current user."""
+        if uid == self.uid:
+            return (mode >> 6) & 7
+        if gid in self.groups:
+            return (mode >> 3) & 7
+        return mode & 7
+
+    def _directory(self, path: str) -> Tuple[bool, bool]:
+        """Whether path and all its ancestors are searchable, and whether path is readable."""
+        cached = self.dirs.get(path)
+        if cached is not None:
+            return cached
+
+        row = self.conn.execute('SELECT mode, uid, gid FROM entries WHERE path = ?', (path,)).fetchone()
+        if row is None:
+            # Search roots and their ancestors aren't indexed; ask the kernel
+            result = (os.access(path, os.X_OK), os.access(path, os.R_OK))
+        else:
+            bits = self._bits(*row)
+            parent_reachable = self._directory(os.path.dirname(path))[0]
+            result = (parent_reachable and bool(bits & 1), bool(bits & 4))
+        self.dirs[path] = result
+        return result
+
+    def visible(self, path: str) -> bool:
+        """A path is visible if its directory is readable and reachable from /."""
+        reachable, readable = self._directory(os.path.dirname(path))
+        return reachable and readable
+
+class FileIndex:
+    """SQLite filename index with trigram postings over distinct names for fuzzy lookups."""
+    BATCH_SIZE = 5000
+    FUZZY_CANDIDATES = 2000
+    FUZZY_SHORT_QUERY = 4
+    DIGEST_MASK = (1 << 63) - 1
+
+    def __init__(self, index_file: Path, generations: int = 1):
+        self.index_file = index_file
+        self.generations = generations
+
+    def generation_file(self, generation: int) -> Path:
+        """Path of an older index generation (0 is the current index)."""
+        if generation == 0:
+            return self.index_file
+        return self.index_file.with_name(f"{self.index_file.name}.{generation}")
+
+    def build(self, entries: Iterator[Tuple[Path, os.stat_result, str]], roots: List[str]) -> int:
+        """Write a fresh index from walker results, replacing the old one atomically."""
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.index_file.with_name(self.index_file.name + '.tmp')
+        if tmp_file.exists():
+            tmp_file.unlink()
+
+        conn = sqlite3.connect(str(tmp_file))
+        conn.execute('PRAGMA journal_mode=OFF')
+        conn.execute('PRAGMA synchronous=OFF')
+        conn.executescript('''
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE names (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+            CREATE TABLE entries (id INTEGER PRIMARY KEY, path TEXT, parent TEXT, name_id INTEGER,
+                                  mode INTEGER, size INTEGER, mtime_ns INTEGER, uid INTEGER,
+                                  gid INTEGER, dev INTEGER, ino INTEGER);
+            CREATE TABLE grams (gram TEXT, name_id INTEGER, PRIMARY KEY (gram, name_id)) WITHOUT ROWID;
+            CREATE TABLE subtrees (path TEXT PRIMARY KEY, digest INTEGER);
+        ''')
+
+        name_ids: Dict[str, int] = {}
+        rows, name_rows, gram_rows, subtree_rows = [], [], [], []
+        count = 0
+
+        # Order-independent digests of each directory's subtree, finished as the
+        # depth-first walk leaves it, let diffs skip unchanged subtrees entirely
+        digests: Dict[str, int] = {}
+        open_dirs: List[str] = []
+
+        def finish_dir():
+            directory = open_dirs.pop()
+            digest = digests.pop(directory)
+            subtree_rows.append((directory, digest))
+            parent = os.path.dirname(directory)
+            if parent in digests:
+                digests[parent] = (digests[parent] + entry_digest(
+                    os.path.basename(directory), 0, 0, 0, digest)) & self.DIGEST_MASK
+
+        def flush():
+            conn.executemany('INSERT INTO names VALUES (?, ?)', name_rows)
+            conn.executemany('INSERT INTO grams VALUES (?, ?)', gram_rows)
+            conn.executemany('INSERT INTO entries VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            conn.executemany('INSERT INTO subtrees VALUES (?, ?)', subtree_rows)
+            name_rows.clear()
+            gram_rows.clear()
+            rows.clear()
+            subtree_rows.clear()
+
+        for path, st, _ in entries:
+            parent = str(path.parent)
+            if not open_dirs or open_dirs[-1] != parent:
+                while open_dirs and not parent.startswith(open_dirs[-1].rstrip('/') + '/'):
+                    finish_dir()
+                open_dirs.append(parent)
+                digests[parent] = 0
+            digests[parent] = (digests[parent] + entry_digest(
+                path.name, st.st_mode, st.st_size, st.st_mtime_ns)) & self.DIGEST_MASK
+
+            name = path.name
+            name_id = name_ids.get(name)
+            if name_id is None:
+                # Postings are kept per distinct name, so common names cost one set of grams
+                name_id = name_ids[name] = len(name_ids) + 1
+                name_rows.append((name_id, name))
+                gram_rows.extend((gram, name_id) for gram in trigrams(name.lower()))
+            rows.append((str(path), parent, name_id, st.st_mode, st.st_size, st.st_mtime_ns,
+                         st.st_uid, st.st_gid, st.st_dev, st.st_ino))
+            count += 1
+            if len(rows) >= self.BATCH_SIZE:
+                flush()
+
+        while open_dirs:
+            finish_dir()
+        flush()
+        conn.execute('CREATE INDEX entries_name ON entries (name_id)')
+        conn.execute('CREATE INDEX entries_path ON entries (path)')
+        conn.execute('CREATE INDEX entries_parent ON entries (parent)')
+        conn.executemany('INSERT INTO meta VALUES (?, ?)', [
+            ('roots', json.dumps([str(Path(root)) for root in roots])),
+            ('built', datetime.now().isoformat()),
+            ('entries', str(count))
+        ])
+        conn.commit()
+        conn.close()
+
+        # Keep older generations around for --diff-index
+        for generation in range(self.generations - 1, 0, -1):
+            older = self.generation_file(generation - 1)
+            if older.exists():
+                os.replace(older, self.generation_file(generation))
+        os.replace(tmp_file, self.index_file)
+        return count
+
+    def roots(self, conn: sqlite3.Connection) -> List[str]:
+        """Search roots the index was built from."""
+        return json.loads(conn.execute("SELECT value FROM meta WHERE key = 'roots'").fetchone()[0])
+
+    def diff(self, other: 'FileIndex') -> Iterator[Tuple[str, str]]:
+        """Stream ('+'|'-'|'M', path) changes from this index to another, skipping equal subtrees."""
+        old_conn, new_conn = self.connect(), other.connect()
+        try:
+            old_roots, new_roots = self.roots(old_conn), other.roots(new_conn)
+            if len(old_roots) == 1 and len(new_roots) == 1:
+                pairs = [(old_roots[0], new_roots[0])]  # e.g. two snapshot roots
+            elif sorted(old_roots) == sorted(new_roots):
+                pairs = [(root, root) for root in sorted(old_roots)]
+            else:
+                raise ValueError("Indexes cover different search roots")
+
+            for old_root, new_root in pairs:
+                yield from self._diff_tree(old_conn, new_conn, old_root, new_root)
+        finally:
+            old_conn.close()
+            new_conn.close()
+
+    def _diff_tree(self, old_conn: sqlite3.Connection, new_conn: sqlite3.Connection,
+                   old_root: str, new_root: str) -> Iterator[Tuple[str, str]]:
+        """Walk both trees from the root, descending only where subtree digests differ."""
+        old_base = '' if old_root == '/' else old_root
+        new_base = '' if new_root == '/' else new_root
+
+        def digest(conn, path):
+            row = conn.execute('SELECT digest FROM subtrees WHERE path = ?', (path,)).fetchone()
+            return row[0] if row else 0
+
+        def children(conn, path):
+            return {os.path.basename(p): (p, mode, size, mtime_ns) for p, mode, size, mtime_ns in conn.execute(
+                'SELECT path, mode, size, mtime_ns FROM entries WHERE parent = ?', (path,))}
+
+        def subtree(conn, path):
+            return conn.execute('SELECT path FROM entries WHERE path > ? AND path < ? ORDER BY path',
+                                (path + '/', path + '0'))
+
+        pending = ['']
+        while pending:
+            rel = pending.pop()
+            old_dir, new_dir = (old_base + rel) or old_root, (new_base + rel) or new_root
+            if digest(old_conn, old_dir) == digest(new_conn, new_dir):
+                continue
+
+            old_children, new_children = children(old_conn, old_dir), children(new_conn, new_dir)
+            for name in sorted(old_children.keys() | new_children.keys(), reverse=True):
+                old, new = old_children.get(name), new_children.get(name)
+                if new is None:
+                    yield '-', old[0]
+                    if stat.S_ISDIR(old[1]):
+                        yield from (('-', p) for p, in subtree(old_conn, old[0]))
+                elif old is None:
+                    yield '+', new[0]
+                    if stat.S_ISDIR(new[1]):
+                        yield from (('+', p) for p, in subtree(new_conn, new[0]))
+                elif stat.S_ISDIR(old[1]) and stat.S_ISDIR(new[1]):
+                    if old[1] != new[1]:
+                        yield 'M', new[0]
+                    pending.append(f"{rel}/{name}")
+                elif old[1:] != new[1:]:
+                    yield 'M', new[0]
+
+    def connect(self) -> sqlite3.Connection:
+        """Open the index read-only."""
+        if not self.index_file.exists():
+            raise FileNotFoundError(f"No index at {self.index_file}; build one with --build-index")
+        return sqlite3.connect(f"file:{self.index_file}?mode=ro", uri=True)
+
+    def access_filter(self, conn: sqlite3.Connection) -> Optional[AccessFilter]:
+        """Result filter for non-root users (see AccessFilter); root sees every entry."""
+        return AccessFilter(conn) if os.geteuid() != 0 else None
+
+    def search(self, patterns: PatternSet) -> Iterator[Tuple[Path, os.stat_result, str]]:
+        """Yield indexed entries whose names match, hiding paths the user couldn't reach."""
+        conn = self.connect()
+        try:
+            matched = {}
+            for name_id, name in conn.execute('SELECT id, name FROM names'):
+                index = patterns.match(name)
+                if index is not None:
+                    matched[name_id] = patterns.patterns[index]
+
+            access = self.access_filter(conn)
+            name_ids = list(matched)
+            for i in range(0, len(name_ids), 500):
+                batch = name_ids[i:i + 500]
+                placeholders = ', '.join('?' * len(batch))
+                rows = conn.execute(
+                    f'SELECT name_id, path, mode, size, mtime_ns, uid, gid, dev, ino FROM entries '
+                    f'WHERE name_id IN ({placeholders})', batch).fetchall()
+                for name_id, path, *meta in rows:
+                    if access and not access.visible(path):
+                        continue
+                    yield Path(path), stored_stat(*meta), matched[name_id]
+        finally:
+            conn.close()
+
+    def fuzzy(self, query: str, limit: int) -> List[Tuple[int, str, int, int, int]]:
+        """Return the best (distance, path, mode, size, mtime_ns) entries for a fuzzy query."""
+        query = query.lower()
+        conn = self.connect()
+        try:
+            grams = sorted(trigrams(query))
+            candidates = []
+            if grams:
+                # Only names sharing the most trigrams with the query are scored
+                placeholders = ', '.join('?' * len(grams))
+                candidates = conn.execute(
+                    f'SELECT names.id, names.name FROM (SELECT name_id, COUNT(*) AS shared FROM grams '
+                    f'WHERE gram IN ({placeholders}) GROUP BY name_id ORDER BY shared DESC LIMIT ?) AS top '
+                    f'JOIN names ON names.id = top.name_id', (*grams, self.FUZZY_CANDIDATES)).fetchall()
+            if not candidates or len(query) < self.FUZZY_SHORT_QUERY:
+                # Short or typo'd queries share few trigrams: also scan for names holding
+                # the query's characters in order, so "cpy" still finds "c.py"
+                like = '%'.join(c.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                                for c in query)
+                candidates = list(dict(candidates + conn.execute(
+                    "SELECT id, name FROM names WHERE name LIKE ? ESCAPE '\\' LIMIT ?",
+                    (f'%{like}%', self.FUZZY_CANDIDATES)).fetchall()).items())
+
+            scored = sorted((fuzzy_distance(query, name.lower()), len(name), name_id)
+                            for name_id, name in candidates)[:limit]
+            distances = {name_id: distance for distance, _, name_id in scored}
+            if not distances:
+                return []
+
+            placeholders = ', '.join('?' * len(distances))
+            rows = conn.execute(
+                f'SELECT name_id, path, mode, size, mtime_ns FROM entries WHERE name_id IN ({placeholders})',
+                tuple(distances)).fetchall()
+            access = self.access_filter(conn)
+            if access:
+                rows = [row for row in rows if access.visible(row[1])]
+        finally:
+            conn.close()
+
+        results = sorted((distances[name_id], len(path), path, mode, size, mtime_ns)
+                         for name_id, path, mode, size, mtime_ns in rows)
+        return [(distance, path, mode, size, mtime_ns)
+                for distance, _, path, mode, size, mtime_ns in results[:limit]]
+
+def walk_stack(stack: List[str], followlinks: bool = False, throttle: Optional[IOThrottle] = None,
+               onerror=None) -> Iterator[Tuple[str, List[str], List[str], Set[str]]]:
+    """Top-down os.walk over an explicit stack, so the unvisited frontier can be saved and resumed.
+
+    Also yields the names that are symlinks, taken from the DirEntry type without an extra lstat.
+    """
+    while stack:
+        top = stack.pop()
+        dirs, files, links = [], [], set()
+        started = time.monotonic()
+        try:
+            with os.scandir(top) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                        if entry.is_symlink():
+                            links.add(entry.name)
+                    except OSError:
+                        is_dir = False
+                    (dirs if is_dir else files).append(entry.name)
+        except OSError as e:
+            if onerror:
+                onerror(e)
+            continue
+
+        if throttle:
+            throttle.listing(time.monotonic() - started)
+            throttle.entries(len(dirs) + len(files))
+
+        yield top, dirs, files, links
+
+        # Pushed after the caller has pruned dirs, reversed so they pop in listing order
+        for name in reversed(dirs):
+            if followlinks or name not in links:
+                stack.append(os.path.join(top, name))
+
+class Checkpoint:
+    """Walk frontier and results saved periodically so an interrupted scan can pick up where it stopped."""
+    def __init__(self, checkpoint_file: Path, interval: float = 30.0):
+        self.checkpoint_file = checkpoint_file
+        self.interval = interval
+        self.conn: Optional[sqlite3.Connection] = None
+        self.buffer: List[Tuple] = []
+        self.last_save = time.monotonic()
+        self.position: Tuple[int, List[str]] = (0, [])  # (search path index, directory stack)
+        self.count = 0
+
+    def load(self) -> bool:
+        """Read a previous checkpoint; returns False if there is none"""
+        if not self.checkpoint_file.exists():
+            return False
+        self.conn = sqlite3.connect(self.checkpoint_file)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'position'").fetchone()
+        self.position = tuple(json.loads(row[0]))
+        self.count = self.conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+        return True
+
+    def results(self) -> Iterator[Tuple[Path, os.stat_result, str]]:
+        """Replay the results saved before the interruption"""
+        if not self.conn:
+            return
+        rows = self.conn.execute('SELECT path, pattern, mode, size, mtime_ns, uid, gid, dev, ino '
+                                 'FROM results ORDER BY rowid')
+        for path, pattern, *meta in rows:
+            yield Path(path), stored_stat(*meta), pattern
+
+    def add(self, filepath: Path, stat_info: os.stat_result, matched: str):
+        """Queue a result for the next save"""
+        mtime_ns = stat_info.st_mtime_ns or int(stat_info.st_mtime * 1e9)
+        self.buffer.append((str(filepath), matched, stat_info.st_mode, stat_info.st_size, mtime_ns,
+                            stat_info.st_uid, stat_info.st_gid, stat_info.st_dev, stat_info.st_ino))
+
+    def due(self) -> bool:
+        """Whether the interval has passed since the last save"""
+        return self.interval > 0 and time.monotonic() - self.last_save >= self.interval
+
+    def save(self, path_index: int, stack: List[str]):
+        """Record the results so far and the directories still to visit in one transaction"""
+        if self.conn is None:
+            self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(self.checkpoint_file)
+            self.conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS results (path TEXT, pattern TEXT, mode INTEGER, '
+                              'size INTEGER, mtime_ns INTEGER, uid INTEGER, gid INTEGER, dev INTEGER, ino INTEGER)')
+        with self.conn:
+            self.conn.executemany('INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', self.buffer)
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('position', ?)",
+                              (json.dumps([path_index, stack]),))
+        self.count += len(self.buffer)
+        self.buffer = []
+        self.last_save = time.monotonic()
+
+    @property
+    def saved(self) -> bool:
+        """Whether there is anything on disk to resume from"""
+        return self.conn is not None
+
+    def discard(self):
+        """Remove the checkpoint once the scan has finished"""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+        self.checkpoint_file.unlink(missing_ok=True)
+
 class FileSearcher:
     def __init__(self):
         self.config_file = Path.home() / ".config" / "filesearch" / "config.json"
+        self.cache_dir = Path.home() / ".cache" / "filesearch"
+        self.index_file = self.cache_dir / "index.db"
+        self.content_cache: Optional[ContentCache] = None
+        self.throttle: Optional[IOThrottle] = None
+        self.unreadable_hits = 0
+        self.unreadable_added = 0
+        self.listing: Tuple[Path, Set[str]] = (Path(), set())  # Directory being walked and its symlinks
+        self.content_hits = 0
+        self.content_misses = 0
+        self.truncated = False  # A search stopped at max_results
         self.load_config()
         self.file_type_colors = {
             # Directories
@@ -157,6 +1326,11 @@ class FileSearcher:
             'web': {'.html', '.htm', '.css', '.js', '.php', '.jsp', '.asp'},
             'system': {'.so', '.a', '.o', '.ko', '.service', '.socket', '.timer'}
         }
+        # Reverse map for one lookup per file; the first category listing an extension wins
+        self.extension_types: Dict[str, str] = {}
+        for file_type, extensions in self.file_extensions.items():
+            for extension in extensions:
+                self.extension_types.setdefault(extension, file_type)
 
     def load_config(self):
         """Load configuration from file or create default config"""
@@ -183,7 +1357,19 @@ class FileSearcher:
             "show_hidden": False,
             "follow_symlinks": False,
             "show_progress": True,
-            "skip_permission_errors": True
+            "skip_permission_errors": True,
+            "binary_files": "skip",
+            "search_archives": False,
+            "respect_gitignore": False,
+            "index_generations": 2,
+            "checkpoint_interval": 30,
+            "nice_io_entries_per_sec": 5000,
+            "unreadable_cache": True,
+            "nice_io_bytes_per_sec": 16 * 1024 * 1024,
+            "system_index": "/var/lib/filesearch/index.db",
+            "system_index_group": "filesearch",
+            "content_cache": True,
+            "content_cache_max_entries": 100000
         }
         
         if self.config_file.exists():
@@ -221,11 +1407,9 @@ class FileSearcher:
                 return 'symlink'
             
             # For regular files, check extension
-            suffix = filepath.suffix.lower()
-            
-            for file_type, extensions in self.file_extensions.items():
-                if suffix in extensions:
-                    return file_type
+            file_type = self.extension_types.get(filepath.suffix.lower())
+            if file_type:
+                return file_type
             
             # Check if executable
             if filepath.is_file() and os.access(filepath, os.X_OK):
@@ -236,6 +1420,19 @@ class FileSearcher:
             
         return 'default'
 
+    def classify(self, name: str, mode: int, is_symlink: bool = False) -> str:
+        """File type from a name, an already fetched st_mode and the walk's symlink flag, without further syscalls"""
+        if stat.S_ISDIR(mode):
+            return 'directory'
+        if is_symlink:
+            return 'symlink'
+        file_type = self.extension_types.get(os.path.splitext(name)[1].lower())
+        if file_type:
+            return file_type
+        if stat.S_ISREG(mode) and mode & 0o111:
+            return 'executable'
+        return 'default'
+
     def colorize_path(self, filepath: Path, file_type: str) -> str:
         """Apply color coding to file path with type indicators"""
         color = self.file_type_colors.get(file_type, Colors.TEXT)
@@ -293,16 +1490,131 @@ class FileSearcher:
             return False
         return True
 
+    def compile_patterns(self, patterns: Union[str, List[str]], use_regex: bool) -> PatternSet:
+        """Build a PatternSet for one or more patterns using the configured case sensitivity"""
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        return PatternSet(list(patterns), use_regex, self.config['case_sensitive'])
+
     def search_files(self, pattern: str, search_paths: List[str], use_regex: bool = False,
                     search_content: bool = False, min_size: Optional[int] = None,
                     max_size: Optional[int] = None, newer_than: Optional[datetime] = None,
                     older_than: Optional[datetime] = None,
                     progress: Optional[ProgressIndicator] = None) -> List[Path]:
         """Search for files and directories matching the pattern"""
-        results = []
+        return [path for path, _, _ in self.iter_search(
+            pattern, search_paths, use_regex, search_content, min_size, max_size,
+            newer_than, older_than, progress)]
+
+    def iter_search(self, pattern: Union[str, List[str], PatternSet], search_paths: List[str],
+                    use_regex: bool = False, search_content: bool = False,
+                    min_size: Optional[int] = None, max_size: Optional[int] = None,
+                    newer_than: Optional[datetime] = None, older_than: Optional[datetime] = None,
+                    progress: Optional[ProgressIndicator] = None,
+                    checkpoint: Optional[Checkpoint] = None
+                    ) -> Iterator[Tuple[Path, os.stat_result, str]]:
+        """Yield (path, stat, matched pattern) for each match as the walker finds it"""
+        patterns = pattern if isinstance(pattern, PatternSet) else self.compile_patterns(pattern, use_regex)
+        pool = None
+        if self.config.get('search_archives', False):
+            pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+        found = checkpoint.count if checkpoint else 0
+        walker = self._walk(patterns, search_paths, search_content, min_size, max_size,
+                            newer_than, older_than, progress, pool, checkpoint)
+        try:
+            for result in walker:
+                # Limit results; only a match past the limit means some were left out
+                if found >= self.config['max_results']:
+                    self.truncated = True
+                    return
+                if checkpoint:
+                    checkpoint.add(*result)
+                yield result
+                found += 1
+        finally:
+            walker.close()
+            if pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def iter_index(self, patterns: PatternSet, search_paths: List[str],
+                   min_size: Optional[int] = None, max_size: Optional[int] = None,
+                   newer_than: Optional[datetime] = None, older_than: Optional[datetime] = None
+                   ) -> Iterator[Tuple[Path, os.stat_result, str]]:
+        """Like iter_search, but answered from the index instead of walking"""
+        prefixes = [os.path.join(os.path.abspath(p), '') for p in search_paths]
+        found = 0
+        for filepath, stat_info, matched in FileIndex(self.index_file).search(patterns):
+            path = str(filepath)
+            if not any(path.startswith(prefix) for prefix in prefixes):
+                continue
+            if not self.matches_size_filter(stat_info.st_size, min_size, max_size):
+                continue
+            if not self.matches_date_filter(stat_info.st_mtime, newer_than, older_than):
+                continue
+            if found >= self.config['max_results']:
+                self.truncated = True
+                return
+            yield filepath, stat_info, matched
+            found += 1
+
+    def _walk(self, patterns: PatternSet, search_paths: List[str], search_content: bool,
+              min_size: Optional[int], max_size: Optional[int], newer_than: Optional[datetime],
+              older_than: Optional[datetime], progress: Optional[ProgressIndicator],
+              pool: Optional[ThreadPoolExecutor], checkpoint: Optional[Checkpoint] = None
+              ) -> Iterator[Tuple[Path, os.stat_result, str]]:
+        """Walk search paths yielding matches, skipping directories known to be unreadable"""
+        unreadable = self.open_unreadable_cache()
+        try:
+            yield from self._walk_paths(patterns, search_paths, search_content, min_size, max_size,
+                                        newer_than, older_than, progress, pool, checkpoint, unreadable)
+        finally:
+            if unreadable:
+                self.unreadable_hits += unreadable.hits
+                self.unreadable_added += len(unreadable.added)
+                unreadable.close()
+
+    def listed_symlink(self, filepath: Path) -> Optional[bool]:
+        """Whether the walk listed filepath as a symlink, or None if it is not from the current listing"""
+        parent, links = self.listing
+        if filepath.parent != parent:
+            return None
+        return filepath.name in links
+
+    def open_unreadable_cache(self) -> Optional[UnreadableDirs]:
+        """Negative cache of unlistable directories, if enabled"""
+        if not (self.config.get('unreadable_cache', True) and self.config.get('skip_permission_errors', True)):
+            return None
+        try:
+            return UnreadableDirs(self.cache_dir / "unreadable.db")
+        except (OSError, sqlite3.Error) as e:
+            print(f"{Colors.YELLOW}Warning: Unreadable directory cache unavailable: {e}{Colors.RESET}",
+                  file=sys.stderr)
+            return None
+
+    def _walk_paths(self, patterns: PatternSet, search_paths: List[str], search_content: bool,
+                    min_size: Optional[int], max_size: Optional[int], newer_than: Optional[datetime],
+                    older_than: Optional[datetime], progress: Optional[ProgressIndicator],
+                    pool: Optional[ThreadPoolExecutor], checkpoint: Optional[Checkpoint],
+                    unreadable: Optional[UnreadableDirs]) -> Iterator[Tuple[Path, os.stat_result, str]]:
+        """Walk search paths yielding matches; archives are scanned by the pool as they are found"""
         seen_inodes = set()  # Prevent duplicate results from hard links
+        pending = set()
+        max_pending = (pool._max_workers * 2) if pool else 0
+        use_ignore_files = self.config.get('respect_gitignore', False)
+        ignore_rules: Dict[str, Optional[IgnoreRules]] = {}
 
-        for search_path in search_paths:
+        def record_unreadable(error: OSError):
+            if unreadable and isinstance(error, PermissionError) and error.filename:
+                try:
+                    unreadable.add(os.stat(error.filename), error.filename)
+                except OSError:
+                    pass
+
+        start_index, resume_stack = checkpoint.position if checkpoint else (0, [])
+        for path_index, search_path in enumerate(search_paths):
+            if path_index < start_index:
+                continue  # Finished before the checkpoint
             try:
                 # Check if we need sudo for this path
                 needs_sudo = not os.access(search_path, os.R_OK)
@@ -312,12 +1624,34 @@ class FileSearcher:
                         print(f"{Colors.YELLOW}Warning: {search_path} requires sudo access{Colors.RESET}")
                     continue
 
-                for root, dirs, files in os.walk(search_path, followlinks=self.config['follow_symlinks']):
+                stack = resume_stack if path_index == start_index and resume_stack else [search_path]
+                for root, dirs, files, links in walk_stack(stack, self.config['follow_symlinks'],
+                                                           self.throttle, record_unreadable):
+                    self.listing = (Path(root), links)
+                    # Everything yielded so far has been consumed, so this is a consistent point to save
+                    if checkpoint and checkpoint.due():
+                        if pending:
+                            yield from self._archive_results(pending, progress)
+                            pending = set()
+                        checkpoint.save(path_index, stack + [root])
+
                     # Skip ignored paths
                     if self.should_ignore_path(root):
                         dirs.clear()  # Don't recurse into ignored directories
                         continue
 
+                    # Prune entries matched by .gitignore/.ignore before walking into them
+                    if use_ignore_files:
+                        key = os.path.normpath(root)
+                        if key in ignore_rules:
+                            rules = ignore_rules.pop(key)
+                        else:
+                            rules = self.initial_ignore_rules(key)
+                        rules = IgnoreRules.for_directory(key, rules)
+                        if rules:
+                            dirs[:] = [d for d in dirs if not rules.ignored(os.path.join(key, d), True)]
+                            files = [f for f in files if not rules.ignored(os.path.join(key, f), False)]
+
                     # Remove hidden directories and excluded patterns
                     if not self.config['show_hidden']:
                         dirs[:] = [d for d in dirs if not d.startswith('.')]
@@ -325,10 +1659,16 @@ class FileSearcher:
                     # Apply exclude patterns
                     dirs[:] = [d for d in dirs if not self.should_exclude(d)]
 
+                    # Children inherit this directory's compiled ignore rules
+                    if use_ignore_files:
+                        for d in dirs:
+                            ignore_rules[os.path.join(key, d)] = rules
+
                     if progress:
                         progress.update(dirs=len(dirs))
                     
                     # Search in directory names
+                    skipped = set()  # Vanished, or known to be unreadable; not worth a failing listing
                     for dirname in dirs:
                         if not self.config['show_hidden'] and dirname.startswith('.'):
                             continue
@@ -343,15 +1683,18 @@ class FileSearcher:
                                 continue
                             seen_inodes.add(inode_key)
                         except (OSError, IOError):
+                            skipped.add(dirname)
                             continue
+
+                        if unreadable and unreadable.known(stat_info):
+                            skipped.add(dirname)
                         
                         # Match pattern for directories
-                        if self.matches_pattern(dirname, pattern, use_regex):
-                            results.append(dirpath)
-                        
-                        # Limit results
-                        if len(results) >= self.config['max_results']:
-                            return results
+                        index = patterns.match(dirname)
+                        if index is not None:
+                            yield dirpath, stat_info, patterns.patterns[index]
+                    if skipped:
+                        dirs[:] = [d for d in dirs if d not in skipped]
                     
                     # Search in filenames
                     for filename in files:
@@ -371,35 +1714,43 @@ class FileSearcher:
                             if inode_key in seen_inodes:
                                 continue
                             seen_inodes.add(inode_key)
-
-                            # Apply size and date filters
-                            if not self.matches_size_filter(stat_info.st_size, min_size, max_size):
-                                continue
-                            if not self.matches_date_filter(stat_info.st_mtime, newer_than, older_than):
-                                continue
-
                         except (OSError, IOError):
                             continue
 
                         if progress:
                             progress.update(files=1)
 
+                        # Archives are searched inside by a worker instead of as raw bytes; members
+                        # are filtered on their own size and date, whatever the archive's are
+                        kind = archive_kind(filename) if pool else None
+                        if kind and stat.S_ISREG(stat_info.st_mode) and (kind != 'compressed' or search_content):
+                            pending.add(pool.submit(self.scan_archive, filepath, stat_info, patterns,
+                                                    search_content, min_size, max_size, newer_than, older_than))
+                            if len(pending) >= max_pending:
+                                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                                yield from self._archive_results(done, progress)
+
+                        # Apply size and date filters
+                        if not self.matches_size_filter(stat_info.st_size, min_size, max_size):
+                            continue
+                        if not self.matches_date_filter(stat_info.st_mtime, newer_than, older_than):
+                            continue
+
                         # Match pattern
-                        matched = False
-                        if self.matches_pattern(filename, pattern, use_regex):
-                            matched = True
-                        elif search_content and filepath.is_file():
-                            if self.search_file_content(filepath, pattern, use_regex):
-                                matched = True
-
-                        if matched:
-                            results.append(filepath)
+                        index = patterns.match(filename)
+                        if index is None and search_content and stat.S_ISREG(stat_info.st_mode) and not kind:
+                            index = self.cached_content_match(filepath, stat_info, patterns)
+
+                        if index is not None:
+                            yield filepath, stat_info, patterns.patterns[index]
                             if progress:
                                 progress.update(matches=1)
 
-                        # Limit results
-                        if len(results) >= self.config['max_results']:
-                            return results
+                    # Report archives finished while this directory was listed
+                    done = {future for future in pending if future.done()}
+                    if done:
+                        pending -= done
+                        yield from self._archive_results(done, progress)
 
             except PermissionError:
                 if not self.config.get('skip_permission_errors', True):
@@ -407,37 +1758,390 @@ class FileSearcher:
             except Exception as e:
                 print(f"{Colors.RED}Error searching {search_path}: {e}{Colors.RESET}", file=sys.stderr)
 
+        yield from self._archive_results(pending, progress)
+
+    def _archive_results(self, futures, progress: Optional[ProgressIndicator]
+                         ) -> Iterator[Tuple[Path, os.stat_result, str]]:
+        """Yield matches from archive scans as they complete"""
+        for future in as_completed(futures):
+            results = future.result()
+            if progress and results:
+                progress.update(matches=len(results))
+            yield from results
+
+    def scan_archive(self, archive: Path, archive_stat: os.stat_result, patterns: PatternSet,
+                     search_content: bool, min_size: Optional[int] = None, max_size: Optional[int] = None,
+                     newer_than: Optional[datetime] = None, older_than: Optional[datetime] = None
+                     ) -> List[Tuple[Path, os.stat_result, str]]:
+        """Match archive member names (and contents) or a compressed file's contents, without extracting"""
+        results = []
+        kind = archive_kind(archive.name)
+
+        def filtered(is_dir: bool, size: int, mtime: float) -> bool:
+            # Like the walk, size and date filters apply to files only
+            return not is_dir and not (self.matches_size_filter(size, min_size, max_size) and
+                                       self.matches_date_filter(mtime, newer_than, older_than))
+
+        try:
+            if kind == 'compressed':
+                if filtered(False, archive_stat.st_size, archive_stat.st_mtime):
+                    return results
+                opener = COMPRESSED_OPENERS[os.path.splitext(archive.name)[1].lower()]
+                with opener(archive, 'rb') as stream:
+                    index = self.search_stream(stream, patterns)
+                if index is not None:
+                    results.append((archive, archive_stat, patterns.patterns[index]))
+
+            elif kind == 'zip':
+                with zipfile.ZipFile(archive) as zf:
+                    for info in zf.infolist():
+                        mtime = time.mktime(info.date_time + (0, 0, -1))
+                        if filtered(info.is_dir(), info.file_size, mtime):
+                            continue
+                        index = patterns.match(os.path.basename(info.filename.rstrip('/')))
+                        if index is None and search_content and not info.is_dir():
+                            with zf.open(info) as stream:
+                                index = self.search_stream(stream, patterns)
+                        if index is not None:
+                            results.append((Path(f"{archive}{ARCHIVE_SEP}{info.filename}"),
+                                            member_stat(info.is_dir(), info.file_size, mtime),
+                                            patterns.patterns[index]))
+
+            elif kind == 'tar':
+                # Stream mode reads members in order without seeking or buffering the archive
+                with tarfile.open(archive, 'r|*') as tf:
+                    for member in tf:
+                        if filtered(member.isdir(), member.size, member.mtime):
+                            continue
+                        index = patterns.match(os.path.basename(member.name.rstrip('/')))
+                        if index is None and search_content and member.isfile():
+                            stream = tf.extractfile(member)
+                            if stream:
+                                index = self.search_stream(stream, patterns)
+                        if index is not None:
+                            results.append((Path(f"{archive}{ARCHIVE_SEP}{member.name}"),
+                                            member_stat(member.isdir(), member.size, member.mtime),
+                                            patterns.patterns[index]))
+
+        except (OSError, EOFError, zipfile.BadZipFile, tarfile.TarError, lzma.LZMAError,
+                zlib.error, RuntimeError) as e:
+            if not self.config.get('skip_permission_errors', True):
+                print(f"{Colors.YELLOW}Warning: Could not read archive {archive}: {e}{Colors.RESET}",
+                      file=sys.stderr)
         return results
 
-    def matches_pattern(self, text: str, pattern: str, use_regex: bool) -> bool:
-        """Check if text matches the search pattern"""
-        if not self.config['case_sensitive']:
-            text = text.lower()
-            pattern = pattern.lower()
-        
-        if use_regex:
-            try:
-                return bool(re.search(pattern, text))
-            except re.error:
-                print(f"{Colors.RED}Invalid regex pattern: {pattern}{Colors.RESET}")
-                return False
+    def search_stream(self, stream, patterns: PatternSet) -> Optional[int]:
+        """Search a decompressed stream chunk by chunk, carrying partial lines between chunks"""
+        binary_policy = self.config.get('binary_files', 'skip')
+        if self.throttle:
+            self.throttle.read(CHUNK_SIZE)
+        chunk = stream.read(CHUNK_SIZE)
+        encoding = sniff_encoding(chunk[:SNIFF_SIZE])
+        if not encoding:
+            if binary_policy == 'skip':
+                return None
+            if binary_policy == 'match':
+                encoding = 'latin-1'
+                patterns = patterns.for_bytes()
+            else:
+                encoding = 'utf-8'
+
+        decoder = codecs.getincrementaldecoder(encoding)(errors='ignore')
+        carry = ''
+        while chunk:
+            text = carry + decoder.decode(chunk)
+            cut = text.rfind('\n') + 1
+            carry = text[cut:]
+            if cut:
+                index = patterns.match(text[:cut])
+                if index is not None:
+                    return index
+            # A single huge line is searched in pieces with a small overlap
+            if len(carry) > CHUNK_SIZE:
+                index = patterns.match(carry)
+                if index is not None:
+                    return index
+                carry = carry[-SNIFF_SIZE:]
+            if self.throttle:
+                self.throttle.read(CHUNK_SIZE)
+            chunk = stream.read(CHUNK_SIZE)
+
+        carry += decoder.decode(b'', final=True)
+        return patterns.match(carry) if carry else None
+
+    def initial_ignore_rules(self, directory: str) -> Optional[IgnoreRules]:
+        """Rules inherited from ancestors of a search root, up to its enclosing git checkout"""
+        if os.path.exists(os.path.join(directory, '.git')):
+            return None
+        ancestors = []
+        parent = os.path.dirname(directory)
+        while parent != directory:
+            ancestors.append(parent)
+            if os.path.exists(os.path.join(parent, '.git')):
+                break
+            directory, parent = parent, os.path.dirname(parent)
+        else:
+            return None  # Not inside a checkout; only the search root's own files apply
+
+        rules = None
+        for ancestor in reversed(ancestors):
+            rules = IgnoreRules.for_directory(ancestor, rules)
+        return rules
+
+    def build_index(self, search_paths: List[str], progress: Optional[ProgressIndicator] = None,
+                    checkpoint: Optional[Checkpoint] = None) -> int:
+        """Walk search paths and store every entry in the filename index"""
+        entries = self._walk(self.compile_patterns('', False), search_paths, False,
+                             None, None, None, None, progress, None, checkpoint)
+        if checkpoint:
+            entries = self._checkpointed(entries, checkpoint)
+        index = FileIndex(self.index_file, self.config.get('index_generations', 2))
+        return index.build(entries, search_paths)
+
+    def _checkpointed(self, entries: Iterator[Tuple[Path, os.stat_result, str]], checkpoint: Checkpoint
+                      ) -> Iterator[Tuple[Path, os.stat_result, str]]:
+        """Replay a checkpoint's entries, then record new ones from the walk as they are consumed"""
+        yield from checkpoint.results()
+        for entry in entries:
+            checkpoint.add(*entry)
+            yield entry
+
+    def open_checkpoint(self, search_paths: List[str], resume: bool, **scan) -> Checkpoint:
+        """Checkpoint for this exact scan; loaded when resuming, replaced otherwise"""
+        signature = {key: self.config.get(key) for key in (
+            'case_sensitive', 'show_hidden', 'follow_symlinks', 'exclude_patterns', 'ignored_paths',
+            'respect_gitignore', 'search_archives', 'binary_files')}
+        signature.update(scan, paths=[os.path.abspath(p) for p in search_paths])
+        key = hashlib.sha1(json.dumps(signature, sort_keys=True, default=str).encode()).hexdigest()[:16]
+        checkpoint = Checkpoint(self.cache_dir / 'checkpoints' / f'{key}.db',
+                                self.config.get('checkpoint_interval', 30))
+        if resume:
+            if checkpoint.load():
+                print(f"{Colors.SAPPHIRE}Resuming from checkpoint with {checkpoint.count} saved results{Colors.RESET}")
+            else:
+                print(f"{Colors.YELLOW}No checkpoint for this scan; starting from the beginning{Colors.RESET}",
+                      file=sys.stderr)
         else:
-            return fnmatch.fnmatch(text, f"*{pattern}*")
+            checkpoint.discard()
+        return checkpoint
 
-    def search_file_content(self, filepath: Path, pattern: str, use_regex: bool) -> bool:
-        """Search for pattern within file content"""
+    def publish_system_index(self):
+        """Share a root-built index with system_index_group (0640), or keep it root-only (0600)
+
+        Every member of the group can read every indexed path; the per-user filtering applied
+        to results only tidies them and does not stop a member opening the database directly.
+        """
+        group = self.config.get('system_index_group')
+        gid = None
+        if group:
+            import grp
+            try:
+                gid = grp.getgrnam(group).gr_gid
+            except KeyError:
+                print(f"{Colors.YELLOW}Warning: group '{group}' not found{Colors.RESET}", file=sys.stderr)
+        # Only the configured system index directory is opened up, never a --index override's
+        if self.index_file == Path(self.config['system_index']):
+            self.index_file.parent.chmod(0o755)
+        index = FileIndex(self.index_file, self.config.get('index_generations', 2))
+        for generation in range(index.generations):
+            path = index.generation_file(generation)
+            if not path.exists():
+                continue
+            if gid is None:
+                path.chmod(0o600)
+            else:
+                # Never world-readable: like mlocate, only the group (or a setgid reader) sees the paths
+                os.chown(path, -1, gid)
+                path.chmod(0o640)
+        if gid is None:
+            print(f"{Colors.YELLOW}Note: the system index is readable by root only; create the group and "
+                  f"set system_index_group to share it{Colors.RESET}", file=sys.stderr)
+
+    def print_index_diff(self, old: FileIndex, new: FileIndex):
+        """Print changes between two index generations as they are found"""
+        colors = {'+': Colors.GREEN, '-': Colors.RED, 'M': Colors.YELLOW}
+        counts = {'+': 0, '-': 0, 'M': 0}
+        print(f"{Colors.SAPPHIRE}Comparing {old.index_file} → {new.index_file}{Colors.RESET}")
+        for change, path in old.diff(new):
+            counts[change] += 1
+            print(f"{colors[change]}{change}{Colors.RESET} {path}")
+        print(f"\n{Colors.GREEN}{counts['+']} added{Colors.RESET}, {Colors.RED}{counts['-']} removed"
+              f"{Colors.RESET}, {Colors.YELLOW}{counts['M']} modified{Colors.RESET}")
+
+    def types_report(self, patterns: PatternSet, search_paths: List[str],
+                     min_size: Optional[int] = None, max_size: Optional[int] = None,
+                     newer_than: Optional[datetime] = None, older_than: Optional[datetime] = None,
+                     progress: Optional[ProgressIndicator] = None) -> Dict:
+        """Count entries and bytes per type and extension in one walk, without keeping results"""
+        types: Dict[str, List[int]] = {}
+        extensions: Dict[Tuple[str, str], List[int]] = {}
+        for filepath, stat_info, _ in self._walk(patterns, search_paths, False, min_size, max_size,
+                                                 newer_than, older_than, progress, None):
+            name = filepath.name
+            # The walk's stat follows links, so whether the entry itself is one comes from its listing
+            file_type = self.classify(name, stat_info.st_mode, bool(self.listed_symlink(filepath)))
+            # A link's stat is its target's; the link itself takes no space worth reporting
+            size = 0 if file_type in ('directory', 'symlink') else stat_info.st_size
+            totals = types.setdefault(file_type, [0, 0])
+            totals[0] += 1
+            totals[1] += size
+            if file_type != 'directory':
+                totals = extensions.setdefault((file_type, os.path.splitext(name)[1].lower()), [0, 0])
+                totals[0] += 1
+                totals[1] += size
+
+        report = {}
+        for file_type, (count, size) in sorted(types.items(), key=lambda item: -item[1][1]):
+            report[file_type] = {'count': count, 'bytes': size, 'extensions': {
+                extension: {'count': ext_count, 'bytes': ext_size}
+                for (ext_type, extension), (ext_count, ext_size)
+                in sorted(extensions.items(), key=lambda item: -item[1][1]) if ext_type == file_type}}
+        return report
+
+    def print_types_report(self, report: Dict, top: int = 5):
+        """Print counts and sizes per type, with each type's largest extensions"""
+        if not report:
+            print(f"{Colors.RED}Nothing found to report{Colors.RESET}")
+            return
+
+        total = sum(totals['bytes'] for totals in report.values()) or 1
+        print(f"{Colors.GREEN}{Colors.BOLD}Storage by type:{Colors.RESET}\n")
+        for file_type, totals in report.items():
+            color = self.file_type_colors.get(file_type, Colors.TEXT)
+            print(f"  {color}{Colors.BOLD}{file_type:<12}{Colors.RESET} {totals['count']:>9} "
+                  f"{self.format_size(totals['bytes']):>10} {Colors.DIM}{totals['bytes'] / total:>6.1%}{Colors.RESET}")
+            for extension, ext_totals in list(totals['extensions'].items())[:top]:
+                print(f"    {Colors.OVERLAY1}{extension or '(none)':<10}{Colors.RESET} {ext_totals['count']:>9} "
+                      f"{self.format_size(ext_totals['bytes']):>10}")
+
+    def export_types_report(self, report: Dict, output_file: str):
+        """Write a types report to a JSON file"""
         try:
-            # Skip binary files and large files
-            if filepath.stat().st_size > 10 * 1024 * 1024:  # 10MB limit
-                return False
-            
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                return self.matches_pattern(content, pattern, use_regex)
+            with open(output_file, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"{Colors.GREEN}Report exported to {output_file}{Colors.RESET}")
+        except IOError as e:
+            print(f"{Colors.RED}Error writing to {output_file}: {e}{Colors.RESET}", file=sys.stderr)
+
+    def print_fuzzy_results(self, query: str, results: List[Tuple[int, str, int, int, int]]):
+        """Print ranked fuzzy matches, best first"""
+        if not results:
+            print(f"{Colors.RED}No indexed names resemble '{query}'{Colors.RESET}")
+            return
+
+        print(f"{Colors.GREEN}{Colors.BOLD}Top {len(results)} indexed matches for '{query}':{Colors.RESET}\n")
+        for distance, path, mode, size, mtime_ns in results:
+            filepath = Path(path)
+            file_type = 'directory' if stat.S_ISDIR(mode) else self.get_file_type(filepath)
+            info = self.format_time(mtime_ns / 1e9)
+            if not stat.S_ISDIR(mode):
+                info = f"{self.format_size(size)}, {info}"
+            print(f"  {Colors.OVERLAY1}{distance:>2}{Colors.RESET} {self.colorize_path(filepath, file_type)} "
+                  f"{Colors.DIM}({info}){Colors.RESET}")
+
+    def content_query_key(self, patterns: PatternSet) -> str:
+        """Identify a content query for the cache, including every option that affects verdicts."""
+        query = json.dumps([patterns.patterns, patterns.use_regex, patterns.case_sensitive,
+                            self.config.get('binary_files', 'skip')])
+        return hashlib.sha1(query.encode()).hexdigest()
+
+    def open_content_cache(self, patterns: PatternSet):
+        """Open the persistent content cache for this query if enabled."""
+        if not self.config.get('content_cache', True):
+            return
+        try:
+            self.content_cache = ContentCache(self.cache_dir / "content.db",
+                                              self.content_query_key(patterns),
+                                              self.config.get('content_cache_max_entries', 100000))
+        except (OSError, sqlite3.Error) as e:
+            print(f"{Colors.YELLOW}Warning: Content cache unavailable: {e}{Colors.RESET}", file=sys.stderr)
+
+    def close_content_cache(self):
+        """Persist and close the content cache."""
+        if self.content_cache:
+            self.content_hits += self.content_cache.hits
+            self.content_misses += self.content_cache.misses
+            self.content_cache.close()
+            self.content_cache = None
+
+    def cached_content_match(self, filepath: Path, stat_info: os.stat_result,
+                             patterns: PatternSet) -> Optional[int]:
+        """Search file content, reusing the cached verdict when the file is unchanged"""
+        if self.content_cache is None:
+            return self.search_file_content(filepath, patterns, stat_info)
+
+        verdict = self.content_cache.get(stat_info)
+        if verdict is None:
+            try:
+                index = self.match_file_content(filepath, patterns, stat_info)
+            except (IOError, UnicodeDecodeError, PermissionError):
+                # A failed read says nothing about the content; don't cache it as a miss
+                return None
+            self.content_cache.put(stat_info, 0 if index is None else index + 1)
+            return index
+        return verdict - 1 if verdict else None
+
+    def search_file_content(self, filepath: Path, patterns: PatternSet,
+                            stat_info: Optional[os.stat_result] = None) -> Optional[int]:
+        """Search file content, returning the index of the matching pattern"""
+        try:
+            return self.match_file_content(filepath, patterns, stat_info)
         except (IOError, UnicodeDecodeError, PermissionError):
-            return False
+            return None
+
+    def match_file_content(self, filepath: Path, patterns: PatternSet,
+                           stat_info: Optional[os.stat_result] = None) -> Optional[int]:
+        """Like search_file_content, but let read errors propagate"""
+        binary_policy = self.config.get('binary_files', 'skip')
+        if stat_info is None:
+            stat_info = filepath.stat()
+
+        # Skip large files
+        if stat_info.st_size > 10 * 1024 * 1024:  # 10MB limit
+            return None
+
+        # A file already sniffed as binary is skipped without opening it
+        cache = self.content_cache
+        encoding = cache.get_encoding(stat_info) if cache else None
+        if encoding == '' and binary_policy == 'skip':
+            return None
+
+        with open(filepath, 'rb') as f:
+            data = b''
+            if encoding is None:
+                # Sniff the head alone, so an unknown binary costs SNIFF_SIZE bytes rather than the file
+                if self.throttle:
+                    self.throttle.read(min(stat_info.st_size, SNIFF_SIZE))
+                data = f.read(SNIFF_SIZE)
+                encoding = sniff_encoding(data)
+                if cache:
+                    cache.put_encoding(stat_info, encoding)
+                if encoding == '' and binary_policy == 'skip':
+                    return None
+            if self.throttle:
+                self.throttle.read(stat_info.st_size - len(data))
+            data += f.read()
+
+        # Reject files missing a required literal before decoding or running the regex
+        if encoding in ('utf-8', 'utf-8-sig') or (not encoding and binary_policy == 'match'):
+            if not patterns.may_match(data):
+                return None
+
+        if encoding:
+            content = data.decode(encoding, errors='ignore')
+        elif binary_policy == 'skip':
+            return None
+        elif binary_policy == 'match':
+            # Compare raw bytes: latin-1 maps each byte to one character
+            content = data.decode('latin-1')
+            patterns = patterns.for_bytes()
+        else:
+            content = data.decode('utf-8', errors='ignore')
+
+        return patterns.match(content)
 
-    def print_results(self, results: List[Path], pattern: str):
+    def print_results(self, results: List[Path], pattern: str,
+                      matched_by: Optional[Dict[Path, str]] = None):
         """Print search results with color coding and type differentiation"""
         if not results:
             print(f"{Colors.RED}No files or directories found matching '{pattern}'{Colors.RESET}")
@@ -479,6 +2183,8 @@ class FileSearcher:
             
             for filepath in sorted(grouped_results[file_type]):
                 colored_path = self.colorize_path(filepath, file_type)
+                if matched_by:
+                    colored_path += f" {Colors.OVERLAY1}[{matched_by[filepath]}]{Colors.RESET}"
                 
                 # Add file/directory info
                 try:
@@ -526,70 +2232,6 @@ class FileSearcher:
         dt = datetime.fromtimestamp(timestamp)
         return dt.strftime('%Y-%m-%d %H:%M')
 
-    def export_json(self, results: List[Path], output_file: str):
-        """Export search results to JSON file."""
-        try:
-            data = []
-            for filepath in results:
-                try:
-                    stat_info = filepath.stat()
-                    item = {
-                        'path': str(filepath),
-                        'name': filepath.name,
-                        'type': 'directory' if filepath.is_dir() else 'file',
-                        'size': stat_info.st_size if not filepath.is_dir() else None,
-                        'modified': datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-                        'is_symlink': filepath.is_symlink()
-                    }
-
-                    if filepath.is_symlink():
-                        try:
-                            item['symlink_target'] = str(filepath.readlink())
-                        except (OSError, IOError):
-                            item['symlink_target'] = None
-
-                    data.append(item)
-                except (OSError, IOError) as e:
-                    print(f"{Colors.YELLOW}Warning: Could not stat {filepath}: {e}{Colors.RESET}",
-                          file=sys.stderr)
-
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=2)
-
-            print(f"{Colors.GREEN}Results exported to {output_file}{Colors.RESET}")
-
-        except IOError as e:
-            print(f"{Colors.RED}Error writing to {output_file}: {e}{Colors.RESET}", file=sys.stderr)
-
-    def export_csv(self, results: List[Path], output_file: str):
-        """Export search results to CSV file."""
-        try:
-            with open(output_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Path', 'Name', 'Type', 'Size (bytes)', 'Modified', 'Is Symlink', 'Symlink Target'])
-
-                for filepath in results:
-                    try:
-                        stat_info = filepath.stat()
-                        row = [
-                            str(filepath),
-                            filepath.name,
-                            'directory' if filepath.is_dir() else 'file',
-                            stat_info.st_size if not filepath.is_dir() else '',
-                            datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-                            'yes' if filepath.is_symlink() else 'no',
-                            str(filepath.readlink()) if filepath.is_symlink() else ''
-                        ]
-                        writer.writerow(row)
-                    except (OSError, IOError) as e:
-                        print(f"{Colors.YELLOW}Warning: Could not stat {filepath}: {e}{Colors.RESET}",
-                              file=sys.stderr)
-
-            print(f"{Colors.GREEN}Results exported to {output_file}{Colors.RESET}")
-
-        except IOError as e:
-            print(f"{Colors.RED}Error writing to {output_file}: {e}{Colors.RESET}", file=sys.stderr)
-
     def run_with_sudo(self, args):
         """Re-run the script with sudo if needed"""
         if os.geteuid() != 0:
@@ -636,6 +2278,22 @@ def parse_date(date_str: str) -> datetime:
     except ValueError:
         raise ValueError(f"Invalid date format: {date_str}. Use YYYY-MM-DD or relative like '7d', '2w'")
 
+def print_resume_hint(checkpoint: Optional[Checkpoint]):
+    """Tell the user an interrupted scan can be continued"""
+    if checkpoint and checkpoint.saved:
+        print(f"\n{Colors.YELLOW}Progress saved; rerun the same command with --resume to continue{Colors.RESET}",
+              file=sys.stderr)
+
+def print_stats(searcher: FileSearcher, progress: ProgressIndicator):
+    """Print walk counters and cache effectiveness"""
+    parts = [f"{progress.dirs_scanned} dirs, {progress.files_scanned} files in "
+             f"{time.monotonic() - progress.started:.1f}s"]
+    if searcher.content_hits or searcher.content_misses:
+        parts.append(f"content cache {searcher.content_hits} hits, {searcher.content_misses} misses")
+    parts.append(f"unreadable dirs {searcher.unreadable_hits} skipped from cache, "
+                 f"{searcher.unreadable_added} newly recorded")
+    print(f"{Colors.OVERLAY1}Stats: {' | '.join(parts)}{Colors.RESET}", file=sys.stderr)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Comprehensive file search tool with Catppuccin colors",
@@ -652,11 +2310,27 @@ Examples:
   %(prog)s "*.mp4" --min-size 100M       # Find video files larger than 100MB
   %(prog)s "*.txt" --newer-than 7d       # Find text files modified in last 7 days
   %(prog)s "report" --export-json out.json  # Export results to JSON
+  %(prog)s "*.log" -q --export-ndjson out.jsonl  # Stream results without displaying them
   %(prog)s "*.py" --exclude "test_*"     # Exclude test files
+  %(prog)s "*.orig" -p . --exec rm {} +  # Delete results in batches across workers
+  %(prog)s "*.core" "*.orig" "*.rej"     # Several patterns in a single pass
+  %(prog)s "error" -c -a -p /var/log     # Search rotated .gz logs and archives too
+  %(prog)s --build-index -p /home        # Build the filename index
+  %(prog)s "cnfig.jsn" --fuzzy           # Rank indexed names by similarity
+  %(prog)s --build-index --system --sudo # Build the shared system-wide index as root
+  %(prog)s "*.iso" --resume               # Continue a scan that was interrupted with Ctrl-C
+  %(prog)s --build-index --nice-io       # Index without starving other disk users
+  %(prog)s --types-report -p ~ --export-json types.json  # What is using the space
+  %(prog)s "*.conf" --use-index --system # Instant lookup, hiding paths you couldn't list
+  %(prog)s --diff-index                  # Changes since the previous index build
+  %(prog)s --diff-index snap1.db snap2.db  # Compare indexes of two snapshot roots
         """
     )
 
-    parser.add_argument('pattern', help='Search pattern for files and directories (supports wildcards)')
+    parser.add_argument('patterns', nargs='*', metavar='pattern',
+                       help='Search pattern(s) for files and directories (supports wildcards)')
+    parser.add_argument('--pattern-file', type=str, metavar='FILE',
+                       help='Read additional patterns from FILE, one per line')
     parser.add_argument('-r', '--regex', action='store_true',
                        help='Use regular expressions')
     parser.add_argument('-c', '--content', action='store_true',
@@ -695,14 +2369,61 @@ Examples:
                        help='Export results to JSON file')
     parser.add_argument('--export-csv', type=str, metavar='FILE',
                        help='Export results to CSV file')
+    parser.add_argument('--export-ndjson', type=str, metavar='FILE',
+                       help='Stream results to a JSON Lines file as they are found')
+    parser.add_argument('--export-sqlite', type=str, metavar='FILE',
+                       help='Stream results into a SQLite database (table: results)')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                       help="Don't display results (keeps memory constant with streaming exports)")
 
     # Exclude patterns
     parser.add_argument('--exclude', action='append', dest='exclude_patterns',
                        help='Exclude pattern (can be used multiple times)')
 
+    # Index
+    parser.add_argument('--build-index', action='store_true',
+                       help='Index every file and directory under the search paths')
+    parser.add_argument('--fuzzy', action='store_true',
+                       help='Rank indexed names by edit distance to the pattern (top --max-results, default 20)')
+    parser.add_argument('--index', type=str, metavar='FILE',
+                       help='Index database (default: ~/.cache/filesearch/index.db)')
+    parser.add_argument('--system', action='store_true',
+                       help='Use the shared root-built index (see system_index in config)')
+    parser.add_argument('--use-index', action='store_true',
+                       help='Match names against the index instead of walking the filesystem')
+    parser.add_argument('--diff-index', nargs='*', metavar='INDEX',
+                       help='Show changes between two index files (default: previous and current generation)')
+
     # Progress
     parser.add_argument('--no-progress', action='store_true',
                        help='Disable progress indicator')
+    parser.add_argument('--nice-io', action='store_true',
+                       help='Throttle entries and bytes per second for background scans (see nice_io_* in config)')
+    parser.add_argument('--types-report', action='store_true',
+                       help='Summarize counts and sizes per file type and extension instead of listing matches')
+    parser.add_argument('--stats', action='store_true',
+                       help='Print scan counters and cache hit counts when done')
+    parser.add_argument('--resume', action='store_true',
+                       help='Continue an interrupted scan or index build from its last checkpoint')
+
+    parser.add_argument('--gitignore', action='store_true',
+                       help='Skip paths ignored by .gitignore/.ignore files')
+    parser.add_argument('-a', '--archives', action='store_true',
+                       help='Search inside .zip/.tar archives and .gz/.bz2/.xz files without extracting')
+    parser.add_argument('--binary', choices=['skip', 'text', 'match'], metavar='POLICY',
+                       help='Binary files in content search: skip (default), text (decode as '
+                            'text) or match (search raw bytes)')
+
+    # Caching
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Disable the content search cache in ~/.cache/filesearch')
+
+    # Actions
+    parser.add_argument('--exec', nargs=argparse.REMAINDER, dest='exec_cmd', metavar='CMD',
+                       help="Run CMD on results; end with '{} +' to batch paths or '{} ;' "
+                            "for one run per path (must be the last option)")
+    parser.add_argument('--exec-jobs', type=int, default=0, metavar='N',
+                       help='Parallel workers for --exec (default: CPU count)')
 
     args = parser.parse_args()
 
@@ -714,6 +2435,21 @@ Examples:
         print(json.dumps(searcher.config, indent=2))
         return
 
+    # Collect patterns from the command line and pattern file
+    pattern_list = list(args.patterns)
+    if args.pattern_file:
+        try:
+            with open(args.pattern_file, 'r') as f:
+                pattern_list.extend(line.rstrip('\n') for line in f
+                                    if line.strip() and not line.startswith('#'))
+        except IOError as e:
+            print(f"{Colors.RED}Error reading pattern file: {e}{Colors.RESET}", file=sys.stderr)
+            sys.exit(1)
+    if args.types_report and not pattern_list:
+        pattern_list = ['*']
+    if not pattern_list and not args.build_index and args.diff_index is None:
+        parser.error('at least one pattern is required')
+
     # Update config based on command line arguments
     if args.max_results:
         searcher.config['max_results'] = args.max_results
@@ -723,11 +2459,23 @@ Examples:
         searcher.config['show_hidden'] = True
     if args.no_progress:
         searcher.config['show_progress'] = False
+    if args.no_cache:
+        searcher.config['content_cache'] = False
+    if args.binary:
+        searcher.config['binary_files'] = args.binary
+    if args.archives:
+        searcher.config['search_archives'] = True
+    if args.gitignore:
+        searcher.config['respect_gitignore'] = True
 
     # Add exclude patterns from command line
     if args.exclude_patterns:
         searcher.config['exclude_patterns'].extend(args.exclude_patterns)
 
+    if args.nice_io:
+        searcher.throttle = IOThrottle(searcher.config.get('nice_io_entries_per_sec', 5000),
+                                       searcher.config.get('nice_io_bytes_per_sec', 16 * 1024 * 1024))
+
     # Handle sudo requirement
     if args.sudo and os.geteuid() != 0:
         if not searcher.run_with_sudo(args):
@@ -757,18 +2505,156 @@ Examples:
         print(f"{Colors.RED}Error: {e}{Colors.RESET}", file=sys.stderr)
         sys.exit(1)
 
+    # Types report: one pass that aggregates instead of collecting results
+    if args.types_report:
+        try:
+            patterns = searcher.compile_patterns(pattern_list, args.regex)
+        except ValueError as e:
+            print(f"{Colors.RED}Error: {e}{Colors.RESET}", file=sys.stderr)
+            sys.exit(1)
+        search_paths = args.paths if args.paths else ['/']
+        progress = ProgressIndicator(show_progress=searcher.config['show_progress'])
+        progress.throttle = searcher.throttle
+        progress.start()
+        try:
+            report = searcher.types_report(patterns, search_paths, min_size, max_size,
+                                           newer_than, older_than, progress)
+        finally:
+            progress.stop()
+        if args.export_json:
+            searcher.export_types_report(report, args.export_json)
+        if not args.quiet:
+            searcher.print_types_report(report)
+        if args.stats:
+            print_stats(searcher, progress)
+        return
+
+    # Index modes: build it, or answer fuzzy queries from it without walking
+    if args.index:
+        searcher.index_file = Path(args.index)
+    elif args.system:
+        searcher.index_file = Path(searcher.config['system_index'])
+    if args.use_index and args.content:
+        parser.error('--use-index only matches names; drop -c/--content')
+    if args.use_index and not searcher.index_file.exists():
+        print(f"{Colors.RED}Error: No index at {searcher.index_file}; build one with --build-index{Colors.RESET}",
+              file=sys.stderr)
+        sys.exit(1)
+    if args.build_index:
+        if args.system and os.geteuid() != 0:
+            print(f"{Colors.RED}Error: the system index must be built as root (add --sudo){Colors.RESET}",
+                  file=sys.stderr)
+            sys.exit(1)
+        if args.system:
+            # Nothing is readable beyond root until publish_system_index decides who may see it
+            os.umask(0o077)
+        search_paths = args.paths if args.paths else ['/']
+        progress = ProgressIndicator(show_progress=searcher.config['show_progress'])
+        progress.throttle = searcher.throttle
+        progress.start()
+        checkpoint = searcher.open_checkpoint(search_paths, args.resume, kind='index',
+                                              index=str(searcher.index_file))
+        print(f"{Colors.SAPPHIRE}Indexing {', '.join(search_paths)}...{Colors.RESET}")
+        try:
+            count = searcher.build_index(search_paths, progress, checkpoint)
+        except KeyboardInterrupt:
+            print_resume_hint(checkpoint)
+            raise
+        finally:
+            progress.stop()
+        checkpoint.discard()
+        if args.system:
+            searcher.publish_system_index()
+        print(f"{Colors.GREEN}Indexed {count} entries into {searcher.index_file}{Colors.RESET}")
+        if args.stats:
+            print_stats(searcher, progress)
+        return
+    if args.diff_index is not None:
+        current = FileIndex(searcher.index_file)
+        if not args.diff_index:
+            old, new = FileIndex(current.generation_file(1)), current
+        elif len(args.diff_index) == 2:
+            old, new = FileIndex(Path(args.diff_index[0])), FileIndex(Path(args.diff_index[1]))
+        else:
+            parser.error('--diff-index takes no arguments or exactly two index files')
+        try:
+            searcher.print_index_diff(old, new)
+        except (FileNotFoundError, ValueError, sqlite3.Error) as e:
+            print(f"{Colors.RED}Error: {e}{Colors.RESET}", file=sys.stderr)
+            sys.exit(1)
+        return
+    if args.fuzzy:
+        query = ' '.join(pattern_list)
+        try:
+            results = FileIndex(searcher.index_file).fuzzy(query, args.max_results or 20)
+        except (FileNotFoundError, sqlite3.Error) as e:
+            print(f"{Colors.RED}Error: {e}{Colors.RESET}", file=sys.stderr)
+            sys.exit(1)
+        searcher.print_fuzzy_results(query, results)
+        return
+
+    # Set up the exec action; a trailing '+' batches paths like find, ';' runs one per path
+    runner = None
+    if args.exec_cmd is not None:
+        command = list(args.exec_cmd)
+        batch = True
+        if command and command[-1] in ('+', ';'):
+            batch = command.pop() == '+'
+        if not command or command[0] == '{}':
+            print(f"{Colors.RED}Error: --exec requires a command{Colors.RESET}", file=sys.stderr)
+            sys.exit(1)
+        runner = ExecRunner(command, jobs=args.exec_jobs, batch=batch)
+        # Every match gets the command unless a limit was asked for explicitly
+        if not args.max_results:
+            searcher.config['max_results'] = sys.maxsize
+
+    # Open streaming exporters before the walk so records are written as found
+    exporters = []
+    try:
+        if args.export_json:
+            exporters.append(JsonExporter(args.export_json))
+        if args.export_csv:
+            exporters.append(CsvExporter(args.export_csv))
+        if args.export_ndjson:
+            exporters.append(JsonLinesExporter(args.export_ndjson))
+        if args.export_sqlite:
+            exporters.append(SqliteExporter(args.export_sqlite))
+    except (IOError, sqlite3.Error) as e:
+        print(f"{Colors.RED}Error opening export file: {e}{Colors.RESET}", file=sys.stderr)
+        sys.exit(1)
+
+    # Compile all patterns into one matcher so a single walk serves them all
+    try:
+        patterns = searcher.compile_patterns(pattern_list, args.regex)
+    except ValueError as e:
+        print(f"{Colors.RED}Error: {e}{Colors.RESET}", file=sys.stderr)
+        sys.exit(1)
+
     # Determine search paths
     search_paths = args.paths if args.paths else ['/']
 
     # Create progress indicator
     progress = ProgressIndicator(show_progress=searcher.config['show_progress'])
+    progress.throttle = searcher.throttle
     progress.start()
 
     # Perform search
-    print(f"{Colors.SAPPHIRE}Searching for '{args.pattern}'...{Colors.RESET}")
-    try:
-        results = searcher.search_files(
-            pattern=args.pattern,
+    print(f"{Colors.SAPPHIRE}Searching for '{patterns}'...{Colors.RESET}")
+    results = []
+    matched_by = {}
+    if args.content:
+        searcher.open_content_cache(patterns)
+    checkpoint = None
+    replayed = 0
+    if args.use_index:
+        matches = searcher.iter_index(patterns, search_paths, min_size, max_size, newer_than, older_than)
+    else:
+        checkpoint = searcher.open_checkpoint(
+            search_paths, args.resume, kind='search', patterns=patterns.patterns, regex=args.regex,
+            content=args.content, filters=[args.min_size, args.max_size, args.newer_than, args.older_than])
+        replayed = checkpoint.count
+        matches = searcher.iter_search(
+            pattern=patterns,
             search_paths=search_paths,
             use_regex=args.regex,
             search_content=args.content,
@@ -776,25 +2662,59 @@ Examples:
             max_size=max_size,
             newer_than=newer_than,
             older_than=older_than,
-            progress=progress
+            progress=progress,
+            checkpoint=checkpoint
         )
+        # Saved results are shown and exported again, but --exec already ran on them
+        matches = chain(checkpoint.results(), matches)
+    completed = False
+    try:
+        for position, (filepath, stat_info, matched) in enumerate(matches):
+            # Filter results based on type preference
+            is_dir = stat.S_ISDIR(stat_info.st_mode)
+            if (args.files_only and is_dir) or (args.dirs_only and not is_dir):
+                continue
+
+            if not args.quiet:
+                results.append(filepath)
+                if len(patterns.patterns) > 1:
+                    matched_by[filepath] = matched
+            if exporters:
+                is_symlink = searcher.listed_symlink(filepath)
+                for exporter in exporters:
+                    exporter.write(filepath, stat_info, matched, is_symlink)
+            # Archive members (st_ino 0) have no path a command could open
+            if runner and stat_info.st_ino and position >= replayed:
+                runner.submit(str(filepath))
+        if checkpoint:
+            checkpoint.discard()
+        completed = True
+    except KeyboardInterrupt:
+        print_resume_hint(checkpoint)
+        raise
     finally:
         progress.stop()
-
-    # Filter results based on type preference
-    if args.files_only:
-        results = [r for r in results if not r.is_dir()]
-    elif args.dirs_only:
-        results = [r for r in results if r.is_dir()]
-
-    # Export if requested
-    if args.export_json:
-        searcher.export_json(results, args.export_json)
-    if args.export_csv:
-        searcher.export_csv(results, args.export_csv)
-
-    # Always display results to terminal (export doesn't suppress display)
-    searcher.print_results(results, args.pattern)
+        searcher.close_content_cache()
+        if runner:
+            # An interrupted walk only waits for batches already running
+            runner.close(abort=not completed)
+        for exporter in exporters:
+            exporter.close()
+
+    # Display results to terminal unless --quiet (export doesn't suppress display)
+    if not args.quiet:
+        searcher.print_results(results, str(patterns), matched_by)
+    if args.stats:
+        print_stats(searcher, progress)
+
+    if runner:
+        if searcher.truncated:
+            print(f"{Colors.YELLOW}Warning: --exec stopped at --max-results "
+                  f"{searcher.config['max_results']}; later matches were not run{Colors.RESET}",
+                  file=sys.stderr)
+        runner.print_summary()
+        if runner.failed:
+            sys.exit(1)
 
 if __name__ == "__main__":
     try:
@@ -10,8 +10,17 @@ import random
 import math
 import sys
 import os
+import json
+import hashlib
+import shutil
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Dict, List, Optional
+from typing import Tuple, Dict, Iterator, List, Optional
 from PIL import Image, ImageDraw
 import argparse
 
@@ -20,7 +29,7 @@ try:
     NUMPY_AVAILABLE = True
 except ImportError:
     NUMPY_AVAILABLE = False
-    print("Warning: NumPy not available. Gradient generation will be slower.", file=sys.stderr)
+    print("Warning: NumPy not available. Tiled and noise patterns will be slower.", file=sys.stderr)
     print("Install with: pip install numpy", file=sys.stderr)
 
 # Constants
@@ -33,7 +42,12 @@ CIRCLE_RADIUS_MAX = 200
 PIXEL_NOISE_SIZE = 8
 PIXEL_NOISE_DENSITY = 0.3
 WAVE_COUNT = 5
+GRADIENT_STOPS = 1024  # Gradient colors per blend; finer than 8-bit channels can show
+STRIP_HEIGHT = 64  # Rows rendered at a time by strip renderers
 LARGE_IMAGE_THRESHOLD = 3840 * 2160  # 4K resolution
+PARALLEL_THRESHOLD = 4096 * 4096  # Renders this big are split into bands across processes
+BAND_HEIGHT = 512
+RENDER_WORKERS = None  # Processes for band rendering; None uses every core
 
 # Color palettes (Catppuccin flavors + Zephyr)
 PALETTES = {
@@ -512,94 +526,227 @@ def darken_color(rgb_color: Tuple[int, int, int], factor: float = 0.7) -> Tuple[
     """Darken an RGB color by a given factor (0.0 = black, 1.0 = original)."""
     return tuple(int(c * factor) for c in rgb_color)
 
-def draw_hexagon(draw: ImageDraw.ImageDraw, x: float, y: float, size: float,
-                 color: Tuple[int, int, int]) -> None:
-    """Draw a hexagon at given position."""
-    points = []
-    for i in range(6):
-        angle = math.pi / 3 * i
-        px = x + size * math.cos(angle)
-        py = y + size * math.sin(angle)
-        points.append((px, py))
-    draw.polygon(points, fill=color)
+# Semantic color slots, shared by every palette. Slot layouts are mode-P images of slot
+# numbers: n is slot n darkened, FULL_BRIGHTNESS + n the same slot left as is (backgrounds)
+SLOTS = list(PALETTES['mocha'])
+FULL_BRIGHTNESS = len(SLOTS)
 
-def generate_geometric_pattern(width: int, height: int, palette_name: str = 'mocha',
-                               pattern: str = 'hexagon', darkness: float = 1.0) -> Image.Image:
-    """Generate geometric tiled patterns."""
-    validate_dimensions(width, height)
-    validate_darkness(darkness)
+# Patterns drawn in flat palette colors, which render once to a slot layout
+LAYOUT_PATTERNS = ('hexagon', 'triangle', 'diamond', 'waves', 'noise', 'plain')
 
+def slot(name: str, darkened: bool = True) -> int:
+    """Index of a semantic color slot in slot layouts."""
+    return SLOTS.index(name) + (0 if darkened else FULL_BRIGHTNESS)
+
+def slot_palette(palette_name: str, darkness: float = 1.0) -> List[int]:
+    """Flat PIL palette coloring slot layouts in one palette, darkness folded in."""
     palette = PALETTES[palette_name]
-    img = Image.new('RGB', (width, height), hex_to_rgb(palette['base']))
-    draw = ImageDraw.Draw(img)
+    colors = [hex_to_rgb(palette[name]) for name in SLOTS]
+    colors = [darken_color(color, darkness) for color in colors] + colors
+    return [channel for color in colors for channel in color]
 
+def apply_palette(layout: Image.Image, palette_name: str, darkness: float = 1.0) -> Image.Image:
+    """Color a slot layout with a palette; re-theming a layout costs only this."""
+    validate_darkness(darkness)
+    img = layout.copy()
+    img.putpalette(slot_palette(palette_name, darkness))
+    return img.convert('RGB')
+
+# Tile colors per geometric pattern, as palette slot names
+TILE_COLORS = {
+    'hexagon': ['mauve', 'pink', 'blue', 'green', 'peach'],
+    'triangle': ['lavender', 'sky', 'teal', 'yellow', 'red'],
+    'diamond': ['pink', 'mauve', 'blue', 'green'],
+}
+
+def tile_layout(pattern: str) -> Tuple[int, int, int, int, List[List[Tuple[float, float]]]]:
+    """Tile size, column step, row step, odd-row shift and shape outlines relative to each tile origin."""
     if pattern == 'hexagon':
         tile_size = HEXAGON_TILE_SIZE
-        colors = [palette['mauve'], palette['pink'], palette['blue'], palette['green'], palette['peach']]
+        size = tile_size // 2
+        # Snap away float noise (40 * cos(pi/3) is 20.000000000000004): it vanishes when added to a
+        # far-off origin, so left in, a tile's edge pixels would depend on where it sits in the frame
+        hexagon = [(round(size * math.cos(math.pi / 3 * i), 9), round(size * math.sin(math.pi / 3 * i), 9))
+                   for i in range(6)]
+        return tile_size, int(tile_size * 0.866), int(tile_size * 0.75), tile_size // 2, [hexagon]
+
+    if pattern == 'triangle':
+        tile_size = TRIANGLE_TILE_SIZE
+        half = tile_size // 2
+        upward = [(0, tile_size), (half, 0), (tile_size, tile_size)]
+        downward = [(half, 0), (tile_size, tile_size), (tile_size + half, 0)]
+        return tile_size, tile_size, int(tile_size * 0.866), 0, [upward, downward]
+
+    tile_size = DIAMOND_TILE_SIZE
+    half = tile_size // 2
+    return tile_size, tile_size, tile_size, 0, [[(half, 0), (tile_size, half), (half, tile_size), (0, half)]]
+
+def tile_grid_shape(width: int, height: int, pattern: str) -> Tuple[int, int, int]:
+    """Rows, columns and shapes per tile needed to cover the frame."""
+    tile_size, step_x, step_y, _, shapes = tile_layout(pattern)
+    rows = len(range(-tile_size, height + tile_size * 2, step_y))
+    columns = len(range(-tile_size, width + tile_size * 2, step_x))
+    return rows, columns, len(shapes)
+
+@lru_cache(maxsize=None)
+def tile_owner_map(pattern: str):
+    """Which neighbouring (row, column, shape) is drawn last over each pixel of one repeating cell."""
+    tile_size, step_x, step_y, shift, shapes = tile_layout(pattern)
+    rows_per_cell = 2 if shift else 1
+    reach = tile_size // min(step_x, step_y) + 2
+
+    # Rasterize the neighbourhood once, in the same row-major order the whole tiling is drawn in.
+    # The margin keeps shapes overlapping the cell from being clipped, which shifts PIL's edges.
+    cell_w, cell_h = step_x, step_y * rows_per_cell
+    owners = Image.new('L', (cell_w + tile_size * 4, cell_h + tile_size * 4), 0)
+    draw = ImageDraw.Draw(owners)
+    offsets = [(0, 0, 0)]  # 0 = background
+    for dr in range(-reach, rows_per_cell + reach):
+        y = dr * step_y + tile_size * 2
+        for dc in range(-reach, reach + 1):
+            x = dc * step_x + (shift if dr % 2 else 0) + tile_size * 2
+            for k, shape in enumerate(shapes):
+                offsets.append((dr, dc, k))
+                draw.polygon([(x + dx, y + dy) for dx, dy in shape], fill=len(offsets) - 1)
+
+    owners = owners.crop((tile_size * 2, tile_size * 2, tile_size * 2 + cell_w, tile_size * 2 + cell_h))
+    dr, dc, k = (np.array(column, dtype=np.int32) for column in zip(*offsets))
+    return np.asarray(owners), dr, dc, k
+
+@lru_cache(maxsize=4)
+def tile_owner_rows(pattern: str, width: int):
+    """Index into a row of cells' (owner, cell column) table for every pixel of one frame-wide row of cells."""
+    tile_size = tile_layout(pattern)[0]
+    owners = tile_owner_map(pattern)[0]
+    cell_w = owners.shape[1]
+
+    # Tiles start one tile size above and left of the frame; every row of cells shares one owner layout
+    u = np.arange(width) + tile_size
+    cell_columns = np.arange(u[-1] // cell_w + 1)
+    return owners[:, u % cell_w].astype(np.int32) * len(cell_columns) + (u // cell_w).astype(np.int32), cell_columns
+
+def render_tile_rows(width: int, y0: int, y1: int, pattern: str, choices, background: int = 0):
+    """Palette slot of every pixel in rows y0..y1 of a tiling, given each tile's chosen slot."""
+    tile_size, _, _, shift, _ = tile_layout(pattern)
+    owners, dr, dc, k = tile_owner_map(pattern)
+    cell_h = owners.shape[0]
+    rows, columns, _ = choices.shape
+    # Shared by every strip or band of the same frame width
+    owner_rows, cell_columns = tile_owner_rows(pattern, width)
+
+    slots = np.empty((y1 - y0, width), dtype=choices.dtype)
+    for cell_row in range((y0 + tile_size) // cell_h, (y1 - 1 + tile_size) // cell_h + 1):
+        # Slot for each (owner, cell column) in this row of cells, then one gather for its pixels
+        table = choices[np.clip(cell_row * (2 if shift else 1) + dr[:, None], 0, rows - 1),
+                        np.clip(cell_columns + dc[:, None], 0, columns - 1), k[:, None]]
+        table[0] = background
+        top = cell_row * cell_h - tile_size
+        start, stop = max(top, y0), min(top + cell_h, y1)
+        slots[start - y0:stop - y0] = table.ravel()[owner_rows[start - top:stop - top]]
+    return slots
+
+def tile_slots(pattern: str) -> List[int]:
+    """Slots a tiling draws with: 0 is the background, 1.. the tile colors."""
+    return [slot('base', darkened=False)] + [slot(name) for name in TILE_COLORS[pattern]]
+
+def tile_choices(width: int, height: int, pattern: str, seed: Optional[int] = None):
+    """Slot of every tile drawn from the seed, and the background slot, for render_tile_rows."""
+    slots = tile_slots(pattern)
+    rng = np.random.default_rng(seed)
+    shape = tile_grid_shape(width, height, pattern)
+    return np.array(slots, dtype=np.uint8)[rng.integers(1, len(slots), size=shape, dtype=np.uint8)], slots[0]
+
+def geometric_layout(width: int, height: int, pattern: str = 'hexagon',
+                     seed: Optional[int] = None) -> Image.Image:
+    """Slot layout of a geometric tiling."""
+    validate_dimensions(width, height)
 
-        # Extend range to ensure full coverage
-        for y in range(-tile_size, height + tile_size * 2, int(tile_size * 0.75)):
-            for x in range(-tile_size, width + tile_size * 2, int(tile_size * 0.866)):
-                # Offset every other row
-                offset_x = (tile_size // 2) if (y // int(tile_size * 0.75)) % 2 else 0
-                hex_x = x + offset_x
+    if NUMPY_AVAILABLE:
+        return render_bands(width, height, render_tile_rows, pattern, *tile_choices(width, height, pattern, seed))
+
+    # Without NumPy, draw each polygon straight into the layout
+    rng = random.Random(seed)
+    slots = tile_slots(pattern)
+    shape = tile_grid_shape(width, height, pattern)
+    tile_size, step_x, step_y, shift, shapes = tile_layout(pattern)
+    img = Image.new('P', (width, height), slots[0])
+    draw = ImageDraw.Draw(img)
+    for row in range(shape[0]):
+        y = row * step_y - tile_size
+        for column in range(shape[1]):
+            x = column * step_x - tile_size + (shift if row % 2 else 0)
+            for outline in shapes:
+                draw.polygon([(x + dx, y + dy) for dx, dy in outline], fill=slots[rng.randint(1, len(slots) - 1)])
 
-                color = random.choice(colors)
-                final_color = darken_color(hex_to_rgb(color), darkness)
-                draw_hexagon(draw, hex_x, y, tile_size // 2, final_color)
+    return img
 
-    elif pattern == 'triangle':
-        tile_size = TRIANGLE_TILE_SIZE
-        colors = [palette['lavender'], palette['sky'], palette['teal'], palette['yellow'], palette['red']]
-
-        # Extend range to ensure full coverage
-        for y in range(-tile_size, height + tile_size * 2, int(tile_size * 0.866)):
-            for x in range(-tile_size, width + tile_size * 2, tile_size):
-                color = random.choice(colors)
-                # Upward triangle
-                points = [(x, y + tile_size), (x + tile_size//2, y), (x + tile_size, y + tile_size)]
-                draw.polygon(points, fill=darken_color(hex_to_rgb(color), darkness))
-
-                # Downward triangle
-                color2 = random.choice(colors)
-                points2 = [(x + tile_size//2, y), (x + tile_size, y + tile_size), (x + tile_size + tile_size//2, y)]
-                draw.polygon(points2, fill=darken_color(hex_to_rgb(color2), darkness))
-
-    elif pattern == 'diamond':
-        tile_size = DIAMOND_TILE_SIZE
-        colors = [palette['pink'], palette['mauve'], palette['blue'], palette['green']]
-
-        # Extend range to ensure full coverage
-        for y in range(-tile_size, height + tile_size * 2, tile_size):
-            for x in range(-tile_size, width + tile_size * 2, tile_size):
-                color = random.choice(colors)
-                # Diamond shape
-                points = [
-                    (x + tile_size//2, y),
-                    (x + tile_size, y + tile_size//2),
-                    (x + tile_size//2, y + tile_size),
-                    (x, y + tile_size//2)
-                ]
-                draw.polygon(points, fill=darken_color(hex_to_rgb(color), darkness))
+def band_workers(width: int, height: int) -> int:
+    """How many processes to render a frame of this size with."""
+    if not NUMPY_AVAILABLE or width * height < PARALLEL_THRESHOLD:
+        return 1
+    return RENDER_WORKERS or os.cpu_count() or 1
 
+def _render_band(shm_name: str, shape: Tuple[int, ...], y0: int, y1: int, render_rows, args) -> None:
+    """Worker side of render_bands: fill rows y0..y1 of the shared frame."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        width = shape[1]
+        frame[y0:y1] = render_rows(width, y0, y1, *args)
+        del frame
+    finally:
+        shm.close()
+
+def render_bands(width: int, height: int, render_rows, *args, mode: str = 'P') -> Image.Image:
+    """Image of render_rows(width, y0, y1, *args), split into bands across processes when large.
+
+    mode is 'P' for rows of palette slots or 'RGB' for rows of pixels.
+    """
+    workers = band_workers(width, height)
+    if workers == 1:
+        return Image.fromarray(render_rows(width, 0, height, *args), mode)
+
+    # Bands only rasterize; anything random was settled by the caller, so the worker count can't change the output
+    shape = (height, width) if mode == 'P' else (height, width, len(mode))
+    shm = shared_memory.SharedMemory(create=True, size=math.prod(shape))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_render_band, shm.name, shape, y0, min(y0 + BAND_HEIGHT, height),
+                                   render_rows, args)
+                       for y0 in range(0, height, BAND_HEIGHT)]
+            for future in futures:
+                future.result()
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.unlink()  # Our mapping stays valid; nothing else needs the name
+
+    # Wrap the shared frame without copying. The segment is attached after img.im, so when the
+    # image goes away it drops its view of the buffer before the segment is closed.
+    img = Image.frombuffer(mode, (width, height), shm.buf, 'raw', mode, 0, 1)
+    img.shared_memory = shm
     return img
 
-def generate_gradient_waves(width: int, height: int, palette_name: str = 'mocha',
-                            darkness: float = 1.0) -> Image.Image:
-    """Generate flowing wave patterns with gradients."""
-    validate_dimensions(width, height)
+def generate_geometric_pattern(width: int, height: int, palette_name: str = 'mocha',
+                               pattern: str = 'hexagon', darkness: float = 1.0,
+                               seed: Optional[int] = None) -> Image.Image:
+    """Generate geometric tiled patterns."""
     validate_darkness(darkness)
+    return apply_palette(geometric_layout(width, height, pattern, seed), palette_name, darkness)
 
-    palette = PALETTES[palette_name]
-    img = Image.new('RGB', (width, height), hex_to_rgb(palette['base']))
+def waves_layout(width: int, height: int) -> Image.Image:
+    """Slot layout of flowing waves."""
+    validate_dimensions(width, height)
+
+    img = Image.new('P', (width, height), slot('base', darkened=False))
     draw = ImageDraw.Draw(img)
 
-    colors = [palette['mauve'], palette['pink'], palette['blue'], palette['lavender'], palette['sky']]
+    colors = ['mauve', 'pink', 'blue', 'lavender', 'sky']
 
     for i in range(WAVE_COUNT):
         wave_height = height // 10
         y_offset = i * (height // 6)
-        color = darken_color(hex_to_rgb(colors[i % len(colors)]), darkness)
 
         points = [(0, y_offset)]
         for x in range(0, width, 10):
@@ -609,68 +756,111 @@ def generate_gradient_waves(width: int, height: int, palette_name: str = 'mocha'
         points.append((width, height))
         points.append((0, height))
 
-        draw.polygon(points, fill=color)
+        draw.polygon(points, fill=slot(colors[i % len(colors)]))
 
     return img
 
+def generate_gradient_waves(width: int, height: int, palette_name: str = 'mocha',
+                            darkness: float = 1.0) -> Image.Image:
+    """Generate flowing wave patterns with gradients."""
+    validate_darkness(darkness)
+    return apply_palette(waves_layout(width, height), palette_name, darkness)
+
 def generate_abstract_circles(width: int, height: int, palette_name: str = 'mocha',
-                              darkness: float = 1.0) -> Image.Image:
+                              darkness: float = 1.0, seed: Optional[int] = None) -> Image.Image:
     """Generate abstract overlapping circles."""
     validate_dimensions(width, height)
     validate_darkness(darkness)
 
     palette = PALETTES[palette_name]
-    img = Image.new('RGB', (width, height), hex_to_rgb(palette['base']))
-    draw = ImageDraw.Draw(img)
+    # One RGBA working buffer for the whole run, converted back to RGB once at the end
+    img = Image.new('RGBA', (width, height), (*hex_to_rgb(palette['base']), 255))
 
     colors = [palette['pink'], palette['mauve'], palette['blue'], palette['green'],
               palette['peach'], palette['yellow'], palette['teal']]
 
     # Generate random circles
+    rng = random.Random(seed)
     for _ in range(CIRCLE_COUNT):
-        x = random.randint(-100, width + 100)
-        y = random.randint(-100, height + 100)
-        radius = random.randint(CIRCLE_RADIUS_MIN, CIRCLE_RADIUS_MAX)
-        color = darken_color(hex_to_rgb(random.choice(colors)), darkness)
+        x = rng.randint(-100, width + 100)
+        y = rng.randint(-100, height + 100)
+        radius = rng.randint(CIRCLE_RADIUS_MIN, CIRCLE_RADIUS_MAX)
+        color = darken_color(hex_to_rgb(rng.choice(colors)), darkness)
+
+        # Only the circle's bounding box, clipped to the frame, is blended
+        left, top = max(x - radius, 0), max(y - radius, 0)
+        right, bottom = min(x + radius + 1, width), min(y + radius + 1, height)
+        if left >= right or top >= bottom:
+            continue
 
         # Create semi-transparent effect by blending
-        overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        overlay = Image.new('RGBA', (right - left, bottom - top), (0, 0, 0, 0))
         overlay_draw = ImageDraw.Draw(overlay)
-        overlay_draw.ellipse([x-radius, y-radius, x+radius, y+radius],
+        overlay_draw.ellipse([x-radius-left, y-radius-top, x+radius-left, y+radius-top],
                            fill=(*color, 100))  # Semi-transparent
 
-        img = Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB')
+        img.alpha_composite(overlay, dest=(left, top))
 
-    return img
+    return img.convert('RGB')
 
-def generate_pixel_noise(width: int, height: int, palette_name: str = 'mocha',
-                         darkness: float = 1.0) -> Image.Image:
-    """Generate organized pixel noise pattern."""
+def noise_grid(columns: int, rows: int, color_count: int, seed: Optional[int] = None):
+    """Per-block color indices for pixel noise: 0 is background, 1..color_count a lit block."""
+    if NUMPY_AVAILABLE:
+        rng = np.random.default_rng(seed)
+        lit = rng.random((rows, columns)) < PIXEL_NOISE_DENSITY
+        choice = rng.integers(1, color_count + 1, size=(rows, columns), dtype=np.uint8)
+        return np.where(lit, choice, 0).astype(np.uint8)
+
+    rng = random.Random(seed)
+    return bytes(rng.randint(1, color_count) if rng.random() < PIXEL_NOISE_DENSITY else 0
+                 for _ in range(rows * columns))
+
+def noise_blocks(width: int, height: int, seed: Optional[int] = None) -> Tuple[bytes, int, int]:
+    """Slot of every noise block, row by row, and the block grid's columns and rows."""
+    colors = ['pink', 'mauve', 'blue', 'green', 'peach', 'yellow', 'teal', 'lavender']
+    slots = [slot('base', darkened=False)] + [slot(name) for name in colors]
+
+    columns = -(-width // PIXEL_NOISE_SIZE)
+    rows = -(-height // PIXEL_NOISE_SIZE)
+    grid = noise_grid(columns, rows, len(colors), seed)
+    return bytes(grid).translate(bytes(slots).ljust(256, b'\0')), columns, rows
+
+def noise_rows(width: int, y0: int, y1: int, blocks: bytes, columns: int):
+    """Palette slot of every pixel in rows y0..y1 of pixel noise, given each block's slot."""
+    first = y0 // PIXEL_NOISE_SIZE
+    grid = np.frombuffer(blocks, dtype=np.uint8).reshape(-1, columns)[first:(y1 - 1) // PIXEL_NOISE_SIZE + 1]
+    # Widen each block row once, then copy it down its rows; far cheaper than a 2-D gather
+    lines = np.repeat(grid, PIXEL_NOISE_SIZE, axis=1)[:, :width]
+    return np.take(lines, np.arange(y0, y1) // PIXEL_NOISE_SIZE - first, axis=0)
+
+def noise_layout(width: int, height: int, seed: Optional[int] = None) -> Image.Image:
+    """Slot layout of organized pixel noise."""
     validate_dimensions(width, height)
-    validate_darkness(darkness)
 
-    palette = PALETTES[palette_name]
-    img = Image.new('RGB', (width, height), hex_to_rgb(palette['base']))
+    # Decide every block up front, then scale the block grid to full size in one step
+    blocks, columns, rows = noise_blocks(width, height, seed)
+    if band_workers(width, height) > 1:
+        return render_bands(width, height, noise_rows, blocks, columns)
 
-    colors = [palette['pink'], palette['mauve'], palette['blue'], palette['green'],
-              palette['peach'], palette['yellow'], palette['teal'], palette['lavender']]
-
-    pixel_size = PIXEL_NOISE_SIZE
-    for y in range(0, height, pixel_size):
-        for x in range(0, width, pixel_size):
-            if random.random() < PIXEL_NOISE_DENSITY:
-                color = darken_color(hex_to_rgb(random.choice(colors)), darkness)
-                for py in range(pixel_size):
-                    for px in range(pixel_size):
-                        if x + px < width and y + py < height:
-                            img.putpixel((x + px, y + py), color)
+    # Nearest-neighbour upscaling of a paletted image beats np.repeat plus a color gather
+    img = Image.frombytes('P', (columns, rows), blocks)
+    img = img.resize((columns * PIXEL_NOISE_SIZE, rows * PIXEL_NOISE_SIZE), Image.NEAREST)
+    return img.crop((0, 0, width, height))
 
-    return img
+def generate_pixel_noise(width: int, height: int, palette_name: str = 'mocha',
+                         darkness: float = 1.0, seed: Optional[int] = None) -> Image.Image:
+    """Generate organized pixel noise pattern."""
+    validate_darkness(darkness)
+    return apply_palette(noise_layout(width, height, seed), palette_name, darkness)
+
+def plain_layout(width: int, height: int, color_name: str = 'base') -> Image.Image:
+    """Slot layout of a solid color."""
+    validate_dimensions(width, height)
+    return Image.new('P', (width, height), slot(color_name))
 
 def generate_plain_background(width: int, height: int, palette_name: str = 'mocha',
                               color_name: str = 'base', darkness: float = 1.0) -> Image.Image:
     """Generate plain solid color background."""
-    validate_dimensions(width, height)
     validate_darkness(darkness)
 
     palette = PALETTES[palette_name]
@@ -679,17 +869,24 @@ def generate_plain_background(width: int, height: int, palette_name: str = 'moch
         print(f"Warning: Color '{color_name}' not found in {palette_name} palette. Using 'base' instead.", file=sys.stderr)
         color_name = 'base'
 
-    color = darken_color(hex_to_rgb(palette[color_name]), darkness)
-    img = Image.new('RGB', (width, height), color)
-    return img
-
-def generate_gradient_background(width: int, height: int, palette_name: str = 'mocha',
-                                color1: str = 'base', color2: str = 'surface0',
-                                direction: str = 'horizontal', darkness: float = 1.0) -> Image.Image:
-    """Generate gradient background between two colors."""
-    validate_dimensions(width, height)
-    validate_darkness(darkness)
-
+    return apply_palette(plain_layout(width, height, color_name), palette_name, darkness)
+
+def render_layout(width: int, height: int, pattern: str, color_name: str = 'base',
+                  seed: Optional[int] = None) -> Image.Image:
+    """Slot layout for any of LAYOUT_PATTERNS."""
+    if pattern in TILE_COLORS:
+        return geometric_layout(width, height, pattern, seed)
+    if pattern == 'waves':
+        return waves_layout(width, height)
+    if pattern == 'noise':
+        return noise_layout(width, height, seed)
+    if pattern == 'plain':
+        return plain_layout(width, height, color_name if color_name in SLOTS else 'base')
+    raise ValueError(f"Pattern '{pattern}' has no slot layout")
+
+def gradient_colors(palette_name: str, color1: str, color2: str,
+                    darkness: float) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+    """Darkened RGB endpoints of a gradient, falling back to defaults for unknown colors."""
     palette = PALETTES[palette_name]
 
     # Validate colors
@@ -701,105 +898,114 @@ def generate_gradient_background(width: int, height: int, palette_name: str = 'm
         color2 = 'surface0'
 
     # Get RGB values and apply darkness
-    rgb1 = darken_color(hex_to_rgb(palette[color1]), darkness)
-    rgb2 = darken_color(hex_to_rgb(palette[color2]), darkness)
+    return darken_color(hex_to_rgb(palette[color1]), darkness), darken_color(hex_to_rgb(palette[color2]), darkness)
 
-    # Use NumPy if available for much faster gradient generation
-    if NUMPY_AVAILABLE:
-        if direction == 'horizontal':
-            # Create a gradient array using NumPy broadcasting
-            ratio = np.linspace(0, 1, width).reshape(1, width)
-            gradient = np.zeros((height, width, 3), dtype=np.uint8)
-            gradient[:, :, 0] = rgb1[0] * (1 - ratio) + rgb2[0] * ratio
-            gradient[:, :, 1] = rgb1[1] * (1 - ratio) + rgb2[1] * ratio
-            gradient[:, :, 2] = rgb1[2] * (1 - ratio) + rgb2[2] * ratio
-            return Image.fromarray(gradient, 'RGB')
-
-        elif direction == 'vertical':
-            ratio = np.linspace(0, 1, height).reshape(height, 1)
-            gradient = np.zeros((height, width, 3), dtype=np.uint8)
-            gradient[:, :, 0] = rgb1[0] * (1 - ratio) + rgb2[0] * ratio
-            gradient[:, :, 1] = rgb1[1] * (1 - ratio) + rgb2[1] * ratio
-            gradient[:, :, 2] = rgb1[2] * (1 - ratio) + rgb2[2] * ratio
-            return Image.fromarray(gradient, 'RGB')
-
-        elif direction == 'diagonal':
-            x = np.arange(width)
-            y = np.arange(height)
-            xx, yy = np.meshgrid(x, y)
-            max_distance = np.sqrt(width**2 + height**2)
-            distance = np.sqrt(xx**2 + yy**2)
-            ratio = distance / max_distance
-
-            gradient = np.zeros((height, width, 3), dtype=np.uint8)
-            gradient[:, :, 0] = rgb1[0] * (1 - ratio) + rgb2[0] * ratio
-            gradient[:, :, 1] = rgb1[1] * (1 - ratio) + rgb2[1] * ratio
-            gradient[:, :, 2] = rgb1[2] * (1 - ratio) + rgb2[2] * ratio
-            return Image.fromarray(gradient, 'RGB')
-
-        elif direction == 'radial':
-            center_x, center_y = width // 2, height // 2
-            max_distance = np.sqrt(center_x**2 + center_y**2)
-            x = np.arange(width) - center_x
-            y = np.arange(height) - center_y
-            xx, yy = np.meshgrid(x, y)
-            distance = np.sqrt(xx**2 + yy**2)
-            ratio = np.minimum(distance / max_distance, 1.0)
-
-            gradient = np.zeros((height, width, 3), dtype=np.uint8)
-            gradient[:, :, 0] = rgb1[0] * (1 - ratio) + rgb2[0] * ratio
-            gradient[:, :, 1] = rgb1[1] * (1 - ratio) + rgb2[1] * ratio
-            gradient[:, :, 2] = rgb1[2] * (1 - ratio) + rgb2[2] * ratio
-            return Image.fromarray(gradient, 'RGB')
-
-    # Fallback to slower pixel-by-pixel method if NumPy not available
-    img = Image.new('RGB', (width, height))
+def gradient_lut(rgb1: Tuple[int, int, int], rgb2: Tuple[int, int, int], stops: int = GRADIENT_STOPS):
+    """RGB color at each of stops evenly spaced points from rgb1 to rgb2."""
+    t = np.linspace(0, 1, stops).reshape(stops, 1)
+    return (np.array(rgb1) * (1 - t) + np.array(rgb2) * t).astype(np.uint8)
 
+def gradient_ratio(width: int, y0: int, y1: int, height: int, direction: str):
+    """Blend ratio (0 at rgb1, 1 at rgb2) of rows y0..y1, as float32 broadcastable to (rows, width)."""
     if direction == 'horizontal':
-        for x in range(width):
-            ratio = x / width
-            r = int(rgb1[0] * (1 - ratio) + rgb2[0] * ratio)
-            g = int(rgb1[1] * (1 - ratio) + rgb2[1] * ratio)
-            b = int(rgb1[2] * (1 - ratio) + rgb2[2] * ratio)
-
-            for y in range(height):
-                img.putpixel((x, y), (r, g, b))
-
-    elif direction == 'vertical':
-        for y in range(height):
-            ratio = y / height
-            r = int(rgb1[0] * (1 - ratio) + rgb2[0] * ratio)
-            g = int(rgb1[1] * (1 - ratio) + rgb2[1] * ratio)
-            b = int(rgb1[2] * (1 - ratio) + rgb2[2] * ratio)
-
-            for x in range(width):
-                img.putpixel((x, y), (r, g, b))
-
-    elif direction == 'diagonal':
+        return np.linspace(0, 1, width, dtype=np.float32).reshape(1, width)
+    if direction == 'vertical':
+        return np.linspace(0, 1, height, dtype=np.float32)[y0:y1].reshape(y1 - y0, 1)
+
+    if direction == 'diagonal':
+        x = np.arange(width, dtype=np.float32)
+        y = np.arange(y0, y1, dtype=np.float32)
         max_distance = math.sqrt(width**2 + height**2)
-        for y in range(height):
-            for x in range(width):
-                distance = math.sqrt(x**2 + y**2)
-                ratio = distance / max_distance
-                r = int(rgb1[0] * (1 - ratio) + rgb2[0] * ratio)
-                g = int(rgb1[1] * (1 - ratio) + rgb2[1] * ratio)
-                b = int(rgb1[2] * (1 - ratio) + rgb2[2] * ratio)
-                img.putpixel((x, y), (r, g, b))
-
-    elif direction == 'radial':
+    else:  # radial
         center_x, center_y = width // 2, height // 2
-        max_distance = math.sqrt(center_x**2 + center_y**2)
+        x = np.arange(width, dtype=np.float32) - center_x
+        y = np.arange(y0, y1, dtype=np.float32) - center_y
+        max_distance = math.sqrt(center_x**2 + center_y**2) or 1.0
+
+    # Squares of the 1-D axes broadcast into the only full-size temporary, then worked on in place
+    ratio = (x * x).reshape(1, width) + (y * y).reshape(y1 - y0, 1)
+    np.sqrt(ratio, out=ratio)
+    ratio *= np.float32(1 / max_distance)
+    return np.minimum(ratio, 1, out=ratio)
+
+def gradient_rows(width: int, y0: int, y1: int, height: int, rgb1: Tuple[int, int, int],
+                  rgb2: Tuple[int, int, int], direction: str, out=None):
+    """RGB pixels of rows y0..y1 of a gradient frame, written into out when given."""
+    shape = (y1 - y0, width)
+    if out is None:
+        out = np.empty(shape + (3,), dtype=np.uint8)
+
+    # Ratios snap to the nearest of GRADIENT_STOPS colors, then one gather paints every pixel
+    index = gradient_ratio(width, y0, y1, height, direction)
+    index *= GRADIENT_STOPS - 1
+    index += 0.5
+    index = index.astype(np.uint16)
+    lut = gradient_lut(rgb1, rgb2)
+    if index.shape[0] == 1:
+        # Horizontal: gather the one line, then repeat it down the rows
+        out[...] = np.take(lut, index, axis=0)
+    elif index.shape[1] == 1:
+        # Vertical: gather a color per row, then spread each channel across it
+        colors = np.take(lut, index[:, 0], axis=0)
+        for channel in range(3):
+            out[:, :, channel] = colors[:, channel, None]
+    else:
+        np.take(lut, index, axis=0, out=out)
+    return out
+
+def generate_gradient_background(width: int, height: int, palette_name: str = 'mocha',
+                                color1: str = 'base', color2: str = 'surface0',
+                                direction: str = 'horizontal', darkness: float = 1.0) -> Image.Image:
+    """Generate gradient background between two colors."""
+    validate_dimensions(width, height)
+    validate_darkness(darkness)
 
-        for y in range(height):
-            for x in range(width):
-                distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                ratio = min(distance / max_distance, 1.0)
-                r = int(rgb1[0] * (1 - ratio) + rgb2[0] * ratio)
-                g = int(rgb1[1] * (1 - ratio) + rgb2[1] * ratio)
-                b = int(rgb1[2] * (1 - ratio) + rgb2[2] * ratio)
-                img.putpixel((x, y), (r, g, b))
+    rgb1, rgb2 = gradient_colors(palette_name, color1, color2, darkness)
 
-    return img
+    # Use NumPy if available for much faster gradient generation
+    if band_workers(width, height) > 1:
+        return render_bands(width, height, gradient_rows, height, rgb1, rgb2, direction, mode='RGB')
+    if NUMPY_AVAILABLE:
+        # Filled a strip at a time, so the float32 ratios never span the whole frame
+        gradient = np.empty((height, width, 3), dtype=np.uint8)
+        for y0 in range(0, height, STRIP_HEIGHT):
+            y1 = min(y0 + STRIP_HEIGHT, height)
+            gradient_rows(width, y0, y1, height, rgb1, rgb2, direction, out=gradient[y0:y1])
+        return Image.fromarray(gradient, 'RGB')
+
+    # Without NumPy, PIL's own primitives stretch a small source to full size
+    if direction in ('horizontal', 'vertical'):
+        # A 1-pixel line of exact colors, repeated across the frame
+        length = width if direction == 'horizontal' else height
+        line = bytearray()
+        for i in range(length):
+            ratio = i / (length - 1) if length > 1 else 0.0
+            line += bytes(int(c1 * (1 - ratio) + c2 * ratio) for c1, c2 in zip(rgb1, rgb2))
+        size = (length, 1) if direction == 'horizontal' else (1, length)
+        return Image.frombytes('RGB', size, bytes(line)).resize((width, height), Image.NEAREST)
+
+    # Diagonal and radial ratios are distances, which Image.radial_gradient already holds: its
+    # 256x256 pixels are sqrt(2) * distance from pixel 128. The frame is mapped onto a box of it
+    # around that pixel, as large as fits, then each channel is one 256-entry lookup.
+    if direction == 'diagonal':
+        origin_x, origin_y = 0, 0
+        max_distance = math.sqrt(width**2 + height**2)
+        scale = 127.5 / max(width, height)
+    else:  # radial
+        origin_x, origin_y = width // 2, height // 2
+        max_distance = math.sqrt(origin_x**2 + origin_y**2) or 1.0
+        scale = 127.5 / max(origin_x + 0.5, origin_y + 0.5, width - origin_x - 0.5, height - origin_y - 0.5)
+    left, top = 128.5 - scale * (origin_x + 0.5), 128.5 - scale * (origin_y + 0.5)
+    # Interpolated when enlarging; small frames take point samples rather than averaging whole areas
+    resample = Image.BILINEAR if scale <= 1 else Image.NEAREST
+    distance = Image.radial_gradient('L').resize((width, height), resample,
+                                                 box=(left, top, left + width * scale, top + height * scale))
+
+    full = math.sqrt(2) * scale * max_distance  # Lookup value where the ratio reaches 1
+    ratios = [min((v + 0.5) / full, 1.0) for v in range(256)]
+    channels = [distance.point([int(c1 * (1 - ratio) + c2 * ratio) for ratio in ratios])
+                for c1, c2 in zip(rgb1, rgb2)]
+    return Image.merge('RGB', channels)
 
 def add_text_overlay(img, text, palette_name='mocha', text_color='text', font_size=None):
     """Add text overlay to the center of the image"""
@@ -917,6 +1123,9 @@ def generate_random_wallpaper(width, height):
     
     # Random font size (if text is chosen)
     font_size = random.randint(32, 120) if text else None
+
+    # Seeded from the module's random state, so random.seed() reproduces the whole wallpaper
+    seed = random.randrange(2 ** 32)
     
     print(f"🎲 Random wallpaper settings:")
     print(f"   Palette: {palette_name}")
@@ -934,13 +1143,13 @@ def generate_random_wallpaper(width, height):
     else:
         print(f"   Pattern: {pattern}")
         if pattern in ['hexagon', 'triangle', 'diamond']:
-            img = generate_geometric_pattern(width, height, palette_name, pattern, darkness)
+            img = generate_geometric_pattern(width, height, palette_name, pattern, darkness, seed)
         elif pattern == 'waves':
             img = generate_gradient_waves(width, height, palette_name, darkness)
         elif pattern == 'circles':
-            img = generate_abstract_circles(width, height, palette_name, darkness)
+            img = generate_abstract_circles(width, height, palette_name, darkness, seed)
         elif pattern == 'noise':
-            img = generate_pixel_noise(width, height, palette_name, darkness)
+            img = generate_pixel_noise(width, height, palette_name, darkness, seed)
     
     # Add random text if chosen
     if text:
@@ -951,30 +1160,88 @@ def generate_random_wallpaper(width, height):
     
     return img
 
+def generate_pattern(width: int, height: int, pattern: str, palette_name: str = 'mocha',
+                     darkness: float = 1.0, color: str = 'base', color1: str = 'base',
+                     color2: str = 'surface0', direction: str = 'horizontal',
+                     seed: Optional[int] = None) -> Image.Image:
+    """Generate any pattern by name."""
+    if pattern in ['hexagon', 'triangle', 'diamond']:
+        return generate_geometric_pattern(width, height, palette_name, pattern, darkness, seed)
+    elif pattern == 'waves':
+        return generate_gradient_waves(width, height, palette_name, darkness)
+    elif pattern == 'circles':
+        return generate_abstract_circles(width, height, palette_name, darkness, seed)
+    elif pattern == 'noise':
+        return generate_pixel_noise(width, height, palette_name, darkness, seed)
+    elif pattern == 'plain':
+        return generate_plain_background(width, height, palette_name, color, darkness)
+    elif pattern == 'gradient':
+        return generate_gradient_background(width, height, palette_name, color1, color2, direction, darkness)
+    raise ValueError(f"Unknown pattern '{pattern}'")
+
+def render_variants(width: int, height: int, pattern: str, palette_names: List[str],
+                    darkness: float = 1.0, seed: Optional[int] = None,
+                    **options) -> Iterator[Tuple[str, Image.Image]]:
+    """Yield (palette name, image) per palette, all sharing one layout."""
+    if pattern in LAYOUT_PATTERNS:
+        color = options.get('color', 'base')
+        if pattern == 'plain' and color not in SLOTS:
+            print(f"Warning: Color '{color}' not found in palettes. Using 'base' instead.", file=sys.stderr)
+        layout = render_layout(width, height, pattern, color, seed)
+        for palette_name in palette_names:
+            yield palette_name, apply_palette(layout, palette_name, darkness)
+        return
+
+    # Circles and gradients blend colors, so each palette is drawn again from the same seed
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    for palette_name in palette_names:
+        yield palette_name, generate_pattern(width, height, pattern, palette_name, darkness, seed=seed, **options)
+
+def parse_palettes(value: str) -> List[str]:
+    """Palette names from a comma-separated list, or every palette for 'all'."""
+    if value == 'all':
+        return list(PALETTES)
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in PALETTES]
+    if unknown or not names:
+        raise ValueError(f"Unknown palette(s): {', '.join(unknown) or value!r}. Available: {', '.join(PALETTES)}")
+    return names
+
+def variant_path(output_path: str, palette_name: str) -> str:
+    """Output path for one palette variant: fills in {palette}, or suffixes the file name."""
+    if '{palette}' in output_path:
+        return output_path.replace('{palette}', palette_name)
+    stem, ext = os.path.splitext(output_path)
+    return f"{stem}_{palette_name}{ext}"
+
+def output_format(output_path: str, format_override: Optional[str] = None) -> str:
+    """Image format to save as, from the override or the file extension."""
+    if format_override:
+        return format_override.upper()
+    ext = os.path.splitext(output_path)[1].lower()
+    format_map = {
+        '.png': 'PNG',
+        '.jpg': 'JPEG',
+        '.jpeg': 'JPEG',
+        '.webp': 'WEBP'
+    }
+    return format_map.get(ext, 'PNG')
+
 def save_image(img: Image.Image, output_path: str, format_override: Optional[str] = None,
-               quality: int = 95) -> None:
+               quality: int = 95, verbose: bool = True) -> None:
     """Save image with error handling and format detection."""
     # Create output directory if it doesn't exist
     output_dir = os.path.dirname(output_path)
     if output_dir and not os.path.exists(output_dir):
         try:
             os.makedirs(output_dir, exist_ok=True)
-            print(f"Created output directory: {output_dir}")
+            if verbose:
+                print(f"Created output directory: {output_dir}")
         except OSError as e:
             raise IOError(f"Failed to create output directory '{output_dir}': {e}")
 
-    # Determine format
-    if format_override:
-        img_format = format_override.upper()
-    else:
-        ext = os.path.splitext(output_path)[1].lower()
-        format_map = {
-            '.png': 'PNG',
-            '.jpg': 'JPEG',
-            '.jpeg': 'JPEG',
-            '.webp': 'WEBP'
-        }
-        img_format = format_map.get(ext, 'PNG')
+    img_format = output_format(output_path, format_override)
 
     try:
         # Save with appropriate settings
@@ -993,13 +1260,327 @@ def save_image(img: Image.Image, output_path: str, format_override: Optional[str
             img.save(output_path, img_format)
 
         # Get file size
-        file_size = os.path.getsize(output_path)
-        size_mb = file_size / (1024 * 1024)
-        print(f"✓ Wallpaper saved as {output_path} ({size_mb:.2f} MB)")
+        if verbose:
+            file_size = os.path.getsize(output_path)
+            size_mb = file_size / (1024 * 1024)
+            print(f"✓ Wallpaper saved as {output_path} ({size_mb:.2f} MB)")
 
     except Exception as e:
         raise IOError(f"Failed to save image to '{output_path}': {e}")
 
+# PNG outputs bigger than this are encoded strip by strip instead of rendering the whole frame;
+# past PARALLEL_THRESHOLD the strips are rendered ahead by band workers while they are encoded
+STREAM_THRESHOLD = LARGE_IMAGE_THRESHOLD
+STREAM_PATTERNS = ('hexagon', 'triangle', 'diamond', 'noise', 'gradient')
+
+class PNGWriter:
+    """Incremental PNG encoder: rows go through zlib as they arrive, so the frame is never held whole."""
+
+    def __init__(self, path: str, width: int, height: int, palette: Optional[List[int]] = None):
+        self.path = path
+        self.width = width
+        self.palette = palette
+        self.previous = None
+        self.compressor = zlib.compressobj(6)
+        self.file = open(path, 'wb')
+        self.file.write(b'\x89PNG\r\n\x1a\n')
+        # 8-bit indexed color with a palette, 8-bit truecolor without
+        self._chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3 if palette else 2, 0, 0, 0))
+        if palette:
+            self._chunk(b'PLTE', bytes(palette))
+
+    def _chunk(self, kind: bytes, data: bytes) -> None:
+        self.file.write(struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data)))
+
+    def write(self, rows) -> None:
+        """Append rows: (n, width) palette indices or (n, width, 3) RGB."""
+        rows = rows.reshape(len(rows), -1)
+        lines = np.empty((len(rows), rows.shape[1] + 1), dtype=np.uint8)
+        if self.palette:
+            lines[:, 0] = 0  # No filter, best for indexed color
+            lines[:, 1:] = rows
+        else:
+            # Up filter: smooth gradients become long runs of small differences
+            lines[:, 0] = 2
+            lines[:, 1:] = rows
+            lines[1:, 1:] -= rows[:-1]
+            if self.previous is not None:
+                lines[0, 1:] -= self.previous
+            self.previous = rows[-1].copy()
+        data = self.compressor.compress(lines.tobytes())
+        if data:
+            self._chunk(b'IDAT', data)
+
+    def close(self) -> None:
+        """Finish the stream and close the file."""
+        self._chunk(b'IDAT', self.compressor.flush())
+        self._chunk(b'IEND', b'')
+        self.file.close()
+
+def can_stream(job: Dict) -> bool:
+    """Whether a job's output can be encoded strip by strip."""
+    return (NUMPY_AVAILABLE and job['pattern'] in STREAM_PATTERNS and not job['text']
+            and job['width'] * job['height'] > STREAM_THRESHOLD
+            and output_format(job['output'], job['format']) == 'PNG')
+
+def stream_variants(job: Dict, outputs: Dict[str, str]) -> None:
+    """Render a job's palette variants in STRIP_HEIGHT strips, each fed straight to a PNGWriter."""
+    width, height = job['width'], job['height']
+    validate_dimensions(width, height)
+    validate_darkness(job['darkness'])
+
+    if job['pattern'] == 'gradient':
+        # Gradients blend colors, so every palette needs its own pass
+        for palette_name, output in outputs.items():
+            rgb1, rgb2 = gradient_colors(palette_name, job['color1'], job['color2'], job['darkness'])
+            write_strips([output], width, height, None, gradient_rows, height, rgb1, rgb2, job['direction'])
+        return
+
+    # Slot strips are the same for every palette, so one pass feeds all the variants
+    if job['pattern'] == 'noise':
+        blocks, columns, _ = noise_blocks(width, height, job['seed'])
+        render_rows, args = noise_rows, (blocks, columns)
+    else:
+        render_rows, args = render_tile_rows, (job['pattern'], *tile_choices(width, height, job['pattern'], job['seed']))
+    palettes = [slot_palette(palette_name, job['darkness']) for palette_name in outputs]
+    write_strips(list(outputs.values()), width, height, palettes, render_rows, *args)
+
+def write_strips(outputs: List[str], width: int, height: int, palettes: Optional[List[List[int]]],
+                 render_rows, *args) -> None:
+    """Encode render_rows(width, y0, y1, *args) to every output, one strip at a time."""
+    writers = []
+    try:
+        for number, output in enumerate(outputs):
+            output_dir = os.path.dirname(output)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            writers.append(PNGWriter(output, width, height, palettes[number] if palettes else None))
+        for rows in render_strips(width, height, render_rows, *args):
+            for writer in writers:
+                writer.write(rows)
+        for writer in writers:
+            writer.close()
+    except OSError as e:
+        for writer in writers:
+            writer.file.close()
+        raise IOError(f"Failed to save image to '{', '.join(outputs)}': {e}")
+
+_strip_job = None  # (width, render_rows, args) of the frame a strip worker renders
+
+def _init_strip_worker(width: int, render_rows, args) -> None:
+    """Install the frame's renderer once per strip worker, so large arguments aren't sent per strip."""
+    global _strip_job
+    _strip_job = (width, render_rows, args)
+
+def _render_strip(y0: int, y1: int):
+    """Worker side of render_strips: rows y0..y1 of the installed frame."""
+    width, render_rows, args = _strip_job
+    return render_rows(width, y0, y1, *args)
+
+def render_strips(width: int, height: int, render_rows, *args) -> Iterator:
+    """render_rows(width, y0, y1, *args) for each STRIP_HEIGHT strip in order, rendered ahead in band workers when large."""
+    strips = [(y0, min(y0 + STRIP_HEIGHT, height)) for y0 in range(0, height, STRIP_HEIGHT)]
+    workers = band_workers(width, height)
+    if workers == 1:
+        for y0, y1 in strips:
+            yield render_rows(width, y0, y1, *args)
+        return
+
+    # A short window of strips in flight keeps every worker busy without holding the frame
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_strip_worker,
+                             initargs=(width, render_rows, args)) as pool:
+        pending = deque()
+        for y0, y1 in strips:
+            pending.append(pool.submit(_render_strip, y0, y1))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+# Finished wallpapers are cached by a hash of everything that shapes them
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'palette_wallpaper')
+CACHE_SIZE_MB = 256
+# Patterns whose output follows from their settings alone, so they cache even without a seed
+DETERMINISTIC_PATTERNS = ('waves', 'plain', 'gradient')
+
+@lru_cache(maxsize=None)
+def renderer_fingerprint() -> str:
+    """Hash of this script and the libraries it renders with, so cached output is dropped when they change."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(f"{Image.__version__} {np.__version__ if NUMPY_AVAILABLE else '-'}".encode())
+    return digest.hexdigest()
+
+class OutputCache:
+    """Content-addressed store of rendered wallpapers, evicting least recently used entries."""
+
+    def __init__(self, cache_dir: str = CACHE_DIR, max_bytes: int = CACHE_SIZE_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key(self, job: Dict, palette_name: str) -> Optional[str]:
+        """Cache key for one palette variant of a job, or None when its output is meant to be random."""
+        if job['seed'] is None and job['pattern'] not in DETERMINISTIC_PATTERNS:
+            return None
+        settings = {name: value for name, value in job.items() if name not in ('palette', 'palettes', 'output', 'format')}
+        settings.update(palette=PALETTES[palette_name], format=output_format(job['output'], job['format']),
+                        renderer=renderer_fingerprint())
+        return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        """Copy a cached wallpaper to output_path; False on a miss."""
+        entry = os.path.join(self.cache_dir, key)
+        try:
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+            shutil.copyfile(entry, output_path)
+            os.utime(entry)  # Most recently used
+        except OSError:
+            return False
+        return True
+
+    def store(self, key: str, output_path: str) -> None:
+        """Add a freshly saved wallpaper, then trim the cache back under its size limit."""
+        entry = os.path.join(self.cache_dir, key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{entry}.{os.getpid()}.tmp"
+            shutil.copyfile(output_path, temp_path)
+            os.replace(temp_path, entry)
+            self.evict()
+        except OSError as e:
+            print(f"Warning: Could not cache {output_path}: {e}", file=sys.stderr)
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # Evicted by another process
+            total -= size
+
+# Job settings and their defaults, mirroring the command line options
+JOB_DEFAULTS = {
+    'width': 2560, 'height': 1600, 'palette': 'mocha', 'palettes': None, 'pattern': 'hexagon',
+    'color': 'base', 'color1': 'base', 'color2': 'surface0', 'direction': 'horizontal',
+    'text': '', 'text_color': 'text', 'font_size': None, 'darkness': 1.0, 'seed': None,
+    'output': 'wallpaper.png', 'format': None, 'quality': 95,
+}
+
+def load_manifest(manifest_path: str) -> List[Dict]:
+    """Read batch jobs: a JSON list of jobs, or {"defaults": {...}, "jobs": [...]}."""
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise IOError(f"Failed to read manifest '{manifest_path}': {e}")
+
+    if isinstance(manifest, list):
+        manifest = {'jobs': manifest}
+    if not isinstance(manifest, dict) or not isinstance(manifest.get('jobs'), list):
+        raise ValueError(f"Manifest '{manifest_path}' must be a list of jobs or an object with a 'jobs' list")
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    jobs = []
+    for number, entry in enumerate(manifest['jobs'], 1):
+        job = {**JOB_DEFAULTS, **manifest.get('defaults', {}), **entry}
+        unknown = set(job) - set(JOB_DEFAULTS)
+        if unknown:
+            raise ValueError(f"Manifest job {number}: unknown setting(s) {', '.join(sorted(unknown))}")
+        if job['palette'] not in PALETTES:
+            raise ValueError(f"Manifest job {number}: unknown palette '{job['palette']}'")
+        if not 1 <= job['quality'] <= 100:
+            raise ValueError(f"Manifest job {number}: quality must be between 1 and 100")
+        if job['seed'] is not None and (not isinstance(job['seed'], int) or job['seed'] < 0):
+            raise ValueError(f"Manifest job {number}: seed must be a non-negative integer")
+        if isinstance(job['palettes'], list):
+            job['palettes'] = ','.join(job['palettes'])
+        if job['palettes']:
+            parse_palettes(job['palettes'])
+        # Relative outputs are relative to the manifest, not wherever the batch is run from
+        job['output'] = os.path.join(base_dir, os.path.expanduser(job['output']))
+        jobs.append(job)
+    return jobs
+
+def run_job(job: Dict, cache: Optional[OutputCache] = None) -> List[Tuple[str, int, bool]]:
+    """Render and save one job; returns (path, size in bytes, served from cache) per file written."""
+    palette_names = parse_palettes(job['palettes']) if job['palettes'] else [job['palette']]
+    outputs = {name: variant_path(job['output'], name) if job['palettes'] else job['output'] for name in palette_names}
+    keys = {name: cache.key(job, name) if cache else None for name in palette_names}
+
+    written = []
+    missing = []
+    for name in palette_names:
+        if keys[name] and cache.fetch(keys[name], outputs[name]):
+            written.append((outputs[name], os.path.getsize(outputs[name]), True))
+        else:
+            missing.append(name)
+    if not missing:
+        return written
+
+    if can_stream(job):
+        stream_variants(job, {name: outputs[name] for name in missing})
+    else:
+        variants = render_variants(job['width'], job['height'], job['pattern'], missing, job['darkness'], job['seed'],
+                                   color=job['color'], color1=job['color1'], color2=job['color2'],
+                                   direction=job['direction'])
+        for palette_name, img in variants:
+            if job['text']:
+                img = add_text_overlay(img, job['text'], palette_name, job['text_color'], job['font_size'])
+            save_image(img, outputs[palette_name], format_override=job['format'], quality=job['quality'],
+                       verbose=False)
+
+    for palette_name in missing:
+        output = outputs[palette_name]
+        if keys[palette_name]:
+            cache.store(keys[palette_name], output)
+        written.append((output, os.path.getsize(output), False))
+    return written
+
+def report_saved(output: str, size: int, cached: bool, prefix: str = '') -> None:
+    """Print one line for a written wallpaper."""
+    print(f"{prefix}✓ Wallpaper saved as {output} ({size / (1024 * 1024):.2f} MB){' (cached)' if cached else ''}")
+
+def init_batch_worker() -> None:
+    """Set up a batch worker process."""
+    global RENDER_WORKERS
+    # Workers are forked with this process's random state; reseed each so circles differ per job
+    random.seed()
+    # Jobs already keep every core busy, so each renders in a single process
+    RENDER_WORKERS = 1
+
+def run_batch(manifest_path: str, workers: Optional[int] = None, cache: Optional[OutputCache] = None) -> int:
+    """Run every manifest job across a process pool, reporting each as it finishes; returns the failure count."""
+    jobs = load_manifest(manifest_path)
+    # Biggest jobs first, so a large render doesn't start last and hold up the whole batch
+    jobs.sort(key=lambda job: job['width'] * job['height'] * (len(parse_palettes(job['palettes'])) if job['palettes'] else 1),
+              reverse=True)
+    workers = workers or os.cpu_count() or 1
+    print(f"Generating {len(jobs)} wallpaper job(s) from {manifest_path} with {min(workers, len(jobs) or 1)} worker(s)...")
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker) as pool:
+        futures = {pool.submit(run_job, job, cache): job for job in jobs}
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                written = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"[{done}/{len(jobs)}] ✗ {futures[future]['output']}: {e}", file=sys.stderr)
+                continue
+            for output, size, cached in written:
+                report_saved(output, size, cached, f"[{done}/{len(jobs)}] ")
+    return failures
+
 def main():
     # Get all available colors from any palette (they're consistent across palettes)
     available_colors = list(PALETTES['mocha'].keys())
@@ -1028,6 +1609,7 @@ Pattern Examples:
   Gradient: --pattern gradient --color1 base --color2 mauve --direction radial
   With text: --pattern plain --color base --text "Arch Linux" --text-color pink
   Dark variant: --pattern waves --darkness 0.2 --palette mocha
+  Every palette from one layout: --pattern hexagon --palettes all --output 'hex_{{palette}}.png'
 
 Gradient Directions:
   horizontal: Left to right gradient
@@ -1044,15 +1626,35 @@ Darkness Examples:
 Random Examples:
   palette_wallpaper.py --random
   palette_wallpaper.py --random --width 1920 --height 1080 --output surprise.png
+  palette_wallpaper.py --random --seed 42     # the same surprise every time
   
   # Generate 5 random wallpapers
   for i in {{1..5}}; do palette_wallpaper.py --random --output random_$i.png; done
 
+Caching:
+  Reproducible output (plain, waves, gradient, or any pattern with --seed) is
+  kept in ~/.cache/palette_wallpaper and copied out when nothing changed, so
+  re-running a theme switch is instant. --no-cache renders regardless.
+
+Batch Examples:
+  palette_wallpaper.py --batch wallpapers.json --workers 8
+
+  A manifest is a list of jobs, or {{"defaults": {{...}}, "jobs": [...]}}. Jobs take
+  the long option names (text_color, font_size, ...) and may give "palettes"
+  as a list; relative outputs are relative to the manifest:
+    {{"defaults": {{"width": 3840, "height": 2160, "pattern": "hexagon"}},
+     "jobs": [{{"palette": "latte", "output": "light.png"}},
+              {{"palette": "mocha", "darkness": 0.3, "output": "dark.png"}}]}}
+
 Output Formats:
   --format png: Lossless PNG (default, largest file size)
   --format jpeg: JPEG with quality setting (smaller, lossy)
   --format webp: WebP with quality setting (good balance)
 
+  PNGs larger than 4K of gradients, noise and tilings without text are
+  rendered in strips and encoded as they go, so memory use stays flat
+  even at 16384x16384.
+
   Examples:
     --output wallpaper.jpg --quality 85
     --output wallpaper.webp --format webp --quality 90
@@ -1072,6 +1674,9 @@ Complete Examples:
     parser.add_argument('--height', type=int, default=1600, help='Height of wallpaper (default: 1600)')
     parser.add_argument('--palette', choices=['mocha', 'macchiato', 'frappe', 'latte', 'zephyr_light', 'zephyr_dusk', 'zephyr_dark', 'harmattan_light', 'harmattan_dusk', 'harmattan_dark', 'solarized_dark', 'solarized_light', 'nord_light', 'nord_dusk', 'nord_dark'],
                        default='mocha', help='Palette to use (default: mocha)')
+    parser.add_argument('--palettes', metavar='LIST',
+                       help="Comma-separated palettes, or 'all', rendered from one layout; "
+                            "{palette} in --output is replaced by each name, otherwise it is appended")
     parser.add_argument('--pattern', choices=['hexagon', 'triangle', 'diamond', 'waves', 'circles', 'noise', 'plain', 'gradient'], 
                        default='hexagon', help='Pattern type (default: hexagon)')
     parser.add_argument('--color', default='base', help=color_help)
@@ -1087,6 +1692,17 @@ Complete Examples:
                        help='Darkness factor: 0.1=very dark, 1.0=normal brightness (default: 1.0)')
     parser.add_argument('--random', action='store_true',
                        help='Generate completely random wallpaper (ignores most other options)')
+    parser.add_argument('--seed', type=int, default=None,
+                       help='Seed for noise, circles and tile colors, making the output reproducible')
+    parser.add_argument('--no-cache', action='store_true',
+                       help=f'Always render, bypassing the output cache in {CACHE_DIR}')
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE_MB, metavar='MB',
+                       help=f'Size limit of the output cache; least recently used wallpapers go first (default: {CACHE_SIZE_MB})')
+    parser.add_argument('--batch', metavar='MANIFEST',
+                       help='Generate every job in a JSON manifest across a process pool (ignores most other options)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker processes for --batch and for rendering very large tilings, noise and gradients, '
+                            'in bands or as PNG strips (default: all cores)')
     parser.add_argument('--output', default='wallpaper.png',
                        help='Output filename (default: wallpaper.png)')
     parser.add_argument('--format', choices=['png', 'jpeg', 'jpg', 'webp'],
@@ -1101,32 +1717,36 @@ Complete Examples:
         if args.quality < 1 or args.quality > 100:
             print("Error: Quality must be between 1 and 100", file=sys.stderr)
             sys.exit(1)
+        if args.workers is not None and args.workers < 1:
+            print("Error: Workers must be at least 1", file=sys.stderr)
+            sys.exit(1)
+        if args.seed is not None and args.seed < 0:
+            print("Error: Seed must be a non-negative integer", file=sys.stderr)
+            sys.exit(1)
+
+        global RENDER_WORKERS
+        RENDER_WORKERS = args.workers
+
+        cache = None if args.no_cache else OutputCache(max_bytes=args.cache_size * 1024 * 1024)
+
+        if args.batch:
+            failures = run_batch(args.batch, args.workers, cache)
+            sys.exit(1 if failures else 0)
 
         if args.random:
             print("🎨 Generating random wallpaper...")
+            if args.seed is not None:
+                random.seed(args.seed)
             img = generate_random_wallpaper(args.width, args.height)
-        else:
-            print(f"Generating {args.width}x{args.height} wallpaper with {args.palette} palette...")
-
-            if args.pattern in ['hexagon', 'triangle', 'diamond']:
-                img = generate_geometric_pattern(args.width, args.height, args.palette, args.pattern, args.darkness)
-            elif args.pattern == 'waves':
-                img = generate_gradient_waves(args.width, args.height, args.palette, args.darkness)
-            elif args.pattern == 'circles':
-                img = generate_abstract_circles(args.width, args.height, args.palette, args.darkness)
-            elif args.pattern == 'noise':
-                img = generate_pixel_noise(args.width, args.height, args.palette, args.darkness)
-            elif args.pattern == 'plain':
-                img = generate_plain_background(args.width, args.height, args.palette, args.color, args.darkness)
-            elif args.pattern == 'gradient':
-                img = generate_gradient_background(args.width, args.height, args.palette, args.color1, args.color2, args.direction, args.darkness)
-
-            # Add text overlay if specified
-            if args.text:
-                img = add_text_overlay(img, args.text, args.palette, args.text_color, args.font_size)
-
-        # Save the image
-        save_image(img, args.output, format_override=args.format, quality=args.quality)
+            save_image(img, args.output, format_override=args.format, quality=args.quality)
+            return
+
+        palette_names = parse_palettes(args.palettes) if args.palettes else [args.palette]
+        print(f"Generating {args.width}x{args.height} wallpaper with {', '.join(palette_names)} palette...")
+
+        job = {name: getattr(args, name) for name in JOB_DEFAULTS}
+        for output, size, cached in run_job(job, cache):
+            report_saved(output, size, cached)
 
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
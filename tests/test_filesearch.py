@@ -0,0 +1,253 @@
+"""Tests for bin/filesearch.py"""
+
+import csv
+import grp
+import json
+import importlib.util
+import os
+import stat
+import zipfile
+from unittest import mock
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / 'bin' / 'filesearch.py'
+
+
+@pytest.fixture(scope='module')
+def filesearch():
+    spec = importlib.util.spec_from_file_location('filesearch', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / 'tree'
+    (root / 'src').mkdir(parents=True)
+    (root / 'src' / 'c.py').write_text('print("hello")\n')
+    (root / 'src' / 'main.py').write_text('import c\n')
+    (root / 'README.md').write_text('readme\n')
+    return root
+
+
+def build_index(filesearch, root, index_file):
+    """Index every entry under root the way build_index feeds the walker's output"""
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            path = Path(dirpath) / name
+            entries.append((path, path.lstat(), '*'))
+    index = filesearch.FileIndex(index_file)
+    index.build(iter(entries), [str(root)])
+    return index
+
+
+def test_index_search_finds_matches(filesearch, tree, tmp_path):
+    index = build_index(filesearch, tree, tmp_path / 'index.db')
+    patterns = filesearch.PatternSet(['*.py'])
+
+    results = list(index.search(patterns))
+
+    assert sorted(path.name for path, _, _ in results) == ['c.py', 'main.py']
+    for path, stat_info, matched in results:
+        assert matched == '*.py'
+        assert stat_info.st_size == path.stat().st_size
+        assert stat_info.st_mtime_ns == path.stat().st_mtime_ns
+
+
+@pytest.fixture
+def searcher(filesearch, tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    searcher = filesearch.FileSearcher()
+    searcher.config['show_progress'] = False
+    searcher.config['ignored_paths'] = []  # tmp_path lives under /tmp
+    return searcher
+
+
+def test_system_index_private_without_group(filesearch, searcher, tree, tmp_path):
+    searcher.config['system_index_group'] = 'no-such-filesearch-group'
+    searcher.index_file = tmp_path / 'system' / 'index.db'
+    build_index(filesearch, tree, searcher.index_file)
+
+    searcher.publish_system_index()
+
+    assert stat.S_IMODE(searcher.index_file.stat().st_mode) == 0o600
+
+
+def test_system_index_shared_with_group(filesearch, searcher, tree, tmp_path):
+    group = grp.getgrgid(os.getgid())
+    searcher.config['system_index_group'] = group.gr_name
+    searcher.index_file = tmp_path / 'system' / 'index.db'
+    build_index(filesearch, tree, searcher.index_file)
+
+    searcher.publish_system_index()
+
+    st = searcher.index_file.stat()
+    assert stat.S_IMODE(st.st_mode) == 0o640
+    assert st.st_gid == group.gr_gid
+
+
+def test_content_cache_skips_failed_reads(filesearch, searcher, tree, tmp_path):
+    patterns = filesearch.PatternSet(['hello'])
+    searcher.content_cache = filesearch.ContentCache(tmp_path / 'content.db', 'hello')
+    path = tree / 'src' / 'c.py'
+    stat_info = path.stat()
+    path.unlink()
+
+    assert searcher.cached_content_match(path, stat_info, patterns) is None
+    assert (stat_info.st_dev, stat_info.st_ino) not in searcher.content_cache.verdicts
+
+    path.write_text('print("hello")\n')
+    stat_info = path.stat()
+    assert searcher.cached_content_match(path, stat_info, patterns) == 0
+    assert searcher.content_cache.get(stat_info) == 1
+
+
+def test_fuzzy_short_query_without_shared_trigrams(filesearch, tree, tmp_path):
+    index = build_index(filesearch, tree, tmp_path / 'index.db')
+
+    results = index.fuzzy('cpy', 5)
+
+    assert results
+    assert Path(results[0][1]).name == 'c.py'
+
+
+def test_throttle_recovers_when_latency_stays_high(filesearch, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(filesearch.time, 'monotonic', lambda: clock[0])
+    throttle = filesearch.IOThrottle(5000, 0)
+
+    for _ in range(10):
+        clock[0] += 1.0
+        throttle.listing(0.001)
+    lowest = 1.0
+    for _ in range(600):
+        clock[0] += 1.0
+        throttle.listing(0.01)
+        lowest = min(lowest, throttle.scale)
+
+    assert lowest == throttle.MIN_SCALE
+    assert throttle.scale == 1.0
+
+
+def test_walk_reports_symlinks_from_directory_entries(filesearch, tree):
+    (tree / 'link.py').symlink_to(tree / 'src' / 'c.py')
+    (tree / 'linkdir').symlink_to(tree / 'src')
+
+    listings = {root: (dirs, links) for root, dirs, _, links in filesearch.walk_stack([str(tree)])}
+
+    assert listings[str(tree)][1] == {'link.py', 'linkdir'}
+    assert 'linkdir' in listings[str(tree)][0]
+    assert os.path.join(str(tree), 'linkdir') not in listings
+
+
+def test_stream_exporter_is_abstract(filesearch, tmp_path):
+    with pytest.raises(TypeError):
+        filesearch.StreamExporter(str(tmp_path / 'out'))
+
+
+def test_exec_abort_drops_pending_batch(filesearch, tmp_path):
+    marker = tmp_path / 'ran'
+    runner = filesearch.ExecRunner(['touch', str(marker)], jobs=1)
+    runner.submit('unused')
+
+    runner.close(abort=True)
+
+    assert not marker.exists()
+    assert runner.batches_run == 0
+
+
+def test_iter_search_reports_truncation(filesearch, searcher, tree):
+    searcher.config['max_results'] = 1
+    results = list(searcher.iter_search('*.py', [str(tree)]))
+    assert len(results) == 1
+    assert searcher.truncated
+
+    searcher.truncated = False
+    searcher.config['max_results'] = 2
+    assert len(list(searcher.iter_search('*.py', [str(tree)]))) == 2
+    assert not searcher.truncated
+
+
+def test_archive_members_filtered_by_own_size(filesearch, searcher, tree):
+    with zipfile.ZipFile(tree / 'big.zip', 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('t/a.txt', 'twenty bytes of text')
+        zf.writestr('t/b.txt', 'x' * (2 * 1024 * 1024))
+    assert (tree / 'big.zip').stat().st_size < 1024 * 1024
+    searcher.config['search_archives'] = True
+
+    results = list(searcher.iter_search('*.txt', [str(tree)], min_size=1024 * 1024))
+
+    assert [path.name for path, _, _ in results] == ['b.txt']
+
+
+def test_json_and_csv_exporters_stream_walk_stats(filesearch, tree, tmp_path):
+    paths = [tree / 'src' / 'c.py', tree / 'src']
+    json_exporter = filesearch.JsonExporter(str(tmp_path / 'out.json'))
+    csv_exporter = filesearch.CsvExporter(str(tmp_path / 'out.csv'))
+    for path in paths:
+        for exporter in (json_exporter, csv_exporter):
+            exporter.write(path, path.stat(), '*', False)
+    json_exporter.close()
+    csv_exporter.close()
+
+    text = (tmp_path / 'out.json').read_text()
+    data = json.loads(text)
+    assert text == json.dumps(data, indent=2)
+    assert [item['path'] for item in data] == [str(path) for path in paths]
+    assert data[0]['size'] == paths[0].stat().st_size
+    rows = list(csv.reader((tmp_path / 'out.csv').open()))
+    assert rows[0] == filesearch.CsvExporter.HEADER
+    assert [row[2] for row in rows[1:]] == ['file', 'directory']
+
+
+def test_binary_file_read_stops_after_sniff(filesearch, searcher, tree):
+    class Recorder:
+        def __init__(self):
+            self.sizes = []
+
+        def read(self, size):
+            self.sizes.append(size)
+
+    path = tree / 'blob.bin'
+    path.write_bytes(b'\0' * (1024 * 1024))
+    searcher.throttle = Recorder()
+
+    assert searcher.search_file_content(path, filesearch.PatternSet(['x'])) is None
+    assert sum(searcher.throttle.sizes) == filesearch.SNIFF_SIZE
+
+
+def test_system_index_override_directory_left_alone(filesearch, searcher, tree, tmp_path):
+    searcher.config['system_index_group'] = None
+    searcher.index_file = tmp_path / 'private' / 'index.db'
+    build_index(filesearch, tree, searcher.index_file)
+    searcher.index_file.parent.chmod(0o700)
+
+    searcher.publish_system_index()
+
+    assert stat.S_IMODE(searcher.index_file.parent.stat().st_mode) == 0o700
+
+
+def test_unreadable_cache_keyed_by_groups(filesearch, tree, tmp_path):
+    cache_file = tmp_path / 'unreadable.db'
+    stat_info = (tree / 'src').stat()
+    cache = filesearch.UnreadableDirs(cache_file)
+    cache.add(stat_info, str(tree / 'src'))
+    cache.close()
+
+    assert filesearch.UnreadableDirs(cache_file).known(stat_info)
+    with mock.patch.object(filesearch.os, 'getgroups', return_value=os.getgroups() + [4242]):
+        assert not filesearch.UnreadableDirs(cache_file).known(stat_info)
+
+
+def test_types_report_counts_symlinks(filesearch, searcher, tree, tmp_path):
+    (tmp_path / 'outside.txt').write_text('outside the tree\n')
+    (tree / 'link.txt').symlink_to(tmp_path / 'outside.txt')
+
+    report = searcher.types_report(filesearch.PatternSet(['*']), [str(tree)])
+
+    assert report['symlink']['count'] == 1
+    assert report['symlink']['bytes'] == 0